@@ -15,6 +15,7 @@ import logging
 import json
 import re
 import hashlib
+import functools
 
 from .datacls import BehaviorArtifact, Pair, Package, PkgInstaller
 from .io import DNSBPath, FileSystem
@@ -39,6 +40,13 @@ except ImportError:
     pass
 logger = logging.getLogger(__name__)
 
+# `${software}` placeholder embedded in image names
+_PLACEHOLDER_RE = re.compile(r'\$\{([^\}]+)\}')
+
+# RECOGNIZED_PATTERNS gains raw strings from plugins and .dnsbattribute at runtime,
+# so patterns are compiled on first use and kept for the process lifetime
+_compile_pattern = functools.lru_cache(maxsize=None)(re.compile)
+
 
 # ============================================================================
 # Top-level Abstract Base Classes
@@ -642,8 +650,8 @@ class ExternalImage(Image, ABC):
             logger.debug(f"[{self.original_name}] No name provided, defaulting to Not a Service")
             return
         
-        placeholder_pattern = r'\$\{([^\}]+)\}'
-        matches = re.findall(placeholder_pattern, self.name)
+        # Names without `${` cannot hold a placeholder; skip the regex scan
+        matches = _PLACEHOLDER_RE.findall(self.name) if "${" in self.name else []
         supported_software = image_registry.get_supports()
         
         if matches:
@@ -660,7 +668,7 @@ class ExternalImage(Image, ABC):
                 if self.software == "NaS":
                     self.software = self._rec_software_from_name(self.name)
             
-            cleaned_name = re.sub(placeholder_pattern, "", self.name)
+            cleaned_name = _PLACEHOLDER_RE.sub("", self.name)
             if cleaned_name:
                 self.name = cleaned_name
                 logger.debug(
@@ -697,10 +705,10 @@ class ExternalImage(Image, ABC):
         
         supported_software = image_registry.get_supports()
         name_lower = name.lower()
-        for soft in constants.RECOGNIZED_PATTERNS.keys():
+        for soft, patterns in constants.RECOGNIZED_PATTERNS.items():
             if soft in supported_software:
-                for pattern in constants.RECOGNIZED_PATTERNS[soft]:
-                    if re.search(pattern, name_lower):
+                for pattern in patterns:
+                    if _compile_pattern(pattern).search(name_lower):
                         return soft
             else:
                 logger.debug(f"[{self.original_name}] Software type '{soft}' is not supported, passed.")
@@ -10,6 +10,7 @@ Concrete classes:
 
 import logging
 import ipaddress
+from functools import lru_cache
 
 from ..abstractions import Behavior, MasterBehavior
 from ..datacls import BehaviorArtifact, VolumeArtifact, BuildContext
@@ -23,6 +24,12 @@ logger = logging.getLogger(__name__)
 # BASE HINT BEHAVIOR
 # ============================================================================
 
+@lru_cache(maxsize=None)
+def _start_index(letters: str, root: str) -> int:
+    """Position in `letters` of the first root server letter configured by `root`."""
+    start_letter = root[0].upper() if root else 'A'
+    return letters.index(start_letter) if start_letter in letters else 0
+
 class HintBehavior(Behavior):
     """Base class for hint behaviors with common hint file generation logic"""
 
@@ -37,8 +44,8 @@ class HintBehavior(Behavior):
         For IP addresses: uses letter-based naming starting from ROOT constant
         """
         target_ips = MasterBehavior.resolve_ips(self.targets, build_context, service_name)
-        start_letter = constants.ROOT[0].upper() if constants.ROOT else 'A'
-        start_idx = self.LETTERS.index(start_letter) if start_letter in self.LETTERS else 0
+        letters = self.LETTERS
+        start_idx = _start_index(letters, constants.ROOT)
         
         lines = []
         for idx, (target_name, target_ip) in enumerate(zip(self.targets, target_ips)):
@@ -46,8 +53,7 @@ class HintBehavior(Behavior):
             try:
                 ipaddress.ip_address(target_name)
                 # Pure IP address: use letter-based naming
-                letter_idx = (start_idx + idx) % len(self.LETTERS)
-                letter = self.LETTERS[letter_idx]
+                letter = letters[(start_idx + idx) % len(letters)]
                 ns_name = f"{letter}.ROOT-SERVERS.NET."
             except ValueError:
                 # Service name: use service-based naming
@@ -9,7 +9,7 @@ import hashlib
 from pathlib import Path
 from ..datacls import BuildContext
 from ..io import DNSBPath
-from ..utils.dnssec import get_dnssec_hooks
+from ..utils.dnssec import get_dnssec_hooks, get_signing_tmp_root
 from ..utils.zone import ZoneName
 
 logger = logging.getLogger(__name__)
@@ -366,7 +366,7 @@ class DNSSECResigner:
             Tuple of (signed_content, ds_content) or None on failure
         """
         try:
-            with tempfile.TemporaryDirectory() as temp_dir:
+            with tempfile.TemporaryDirectory(dir=get_signing_tmp_root()) as temp_dir:
                 temp_path = Path(temp_dir)
 
                 # Write unsigned zone content
@@ -417,18 +417,15 @@ class DNSSECResigner:
                 (temp_path / f"{zsk_basename}.private").write_text(zsk_private_content)
                 
                 # Append key includes to zone file
-                unsigned_file.write_text(
-                    unsigned_file.read_text() + "\n" +
-                    f"$INCLUDE {ksk_basename}.key\n" +
-                    f"$INCLUDE {zsk_basename}.key\n"
-                )
+                with unsigned_file.open("a") as f:
+                    f.write(f"\n$INCLUDE {ksk_basename}.key\n$INCLUDE {zsk_basename}.key\n")
                 
                 # Sign the zone
                 logger.debug(f"[DNSSEC-Resigner] Signing zone '{zone.fqdn}' with dnssec-signzone")
                 sign_result = subprocess.run(
                     [
                         "dnssec-signzone",
-                        "-3", hashlib.sha1(zone.fqdn.encode()).hexdigest()[:16],
+                        "-3", hashlib.blake2b(zone.fqdn.encode(), digest_size=8).hexdigest(),
                         "-N", "INCREMENT",
                         "-o", zone.fqdn,
                         str(unsigned_file)
@@ -25,11 +25,14 @@ class Resolver:
         self.pr_blds = pr_blds
         self.resolved_builds: Dict[str, Dict] = {}
         self.resolving_stack: set = set()
+        # Snapshot of config.builds_config (a fresh model_dump per access), taken once in resolve_all
+        self.builds_config: Dict[str, Dict] = {}
 
     def resolve_all(self) -> Dict[str, Dict]:
         """The main entry point to resolve all services."""
         logger.info("Resolving all build configurations...")
-        for service_name in self.config.builds_config.keys():
+        self.builds_config = self.config.builds_config
+        for service_name in self.builds_config.keys():
             self._resolve_service(service_name)
         logger.info("All build configurations resolved.")
         return self.resolved_builds
@@ -45,10 +48,10 @@ class Resolver:
         logger.debug(f"[Resolver] Starting resolution for service '{service_name}'...")
         self.resolving_stack.add(service_name)
         
-        if service_name not in self.config.builds_config:
+        if service_name not in self.builds_config:
             raise BuildDefinitionError(f"Build configuration for '{service_name}' not found.")
         
-        service_conf = self.config.builds_config[service_name]
+        service_conf = self.builds_config[service_name]
         ref = service_conf.get('ref')
         parent_conf = {}
         
@@ -3,6 +3,7 @@ from typing import Dict, Any, List, Tuple, Optional
 import collections
 import hashlib
 import json
+import os
 import threading
 from dataclasses import dataclass, field
 from datetime import datetime
@@ -410,7 +411,7 @@ class ServiceHandler:
                 dcr_path = f"./{self.service_name}/contents/{filename}"
                 if (len(suffixes) >= 1 and suffixes[-1] == '.conf') or (len(suffixes) >= 2 and suffixes[-2] == '.conf'):
                     blk = suffixes[-1].strip(".") if (len(suffixes) >= 2 and suffixes[-2] == '.conf') else 'global'
-                    _blks = constants.DNS_SOFTWARE_BLOCKS.get(self.image_obj.software, set())
+                    _blks = constants.DNS_SOFTWARE_BLOCKS.get(self.image_obj.software, frozenset())
                     if blk in _blks:
                         if not pairs.get(blk, None):
                             pairs[blk] = Pair(src=target_path, dst=container_path, dcr=dcr_path)
@@ -490,14 +491,15 @@ class ServiceHandler:
         enable_dnssec, dnssec_includes, dnssec_hooks = get_dnssec_config(self.build_conf)
 
         # 2. Generate zone files and artifacts for each aggregated zone
-        for zone, records in records_by_zone.items():
-            # Check if there's a custom ZoneGenerator for this software
-            from ..plugins import get_plugin_manager
-            plugin_manager = get_plugin_manager()
-            custom_generator_class = plugin_manager.registry.get_zone_generator(
-                self.image_obj.software
-            )
+        # Check if there's a custom ZoneGenerator for this software
+        from ..plugins import get_plugin_manager
+        plugin_manager = get_plugin_manager()
+        custom_generator_class = plugin_manager.registry.get_zone_generator(
+            self.image_obj.software
+        )
 
+        generators = []
+        for zone, records in records_by_zone.items():
             if custom_generator_class:
                 # Use custom ZoneGenerator from plugin
                 generator = custom_generator_class(
@@ -516,8 +518,21 @@ class ServiceHandler:
                     enable_dnssec=enable_dnssec,
                     build_conf=self.build_conf
                 )
-            artifacts = generator.generate()  # Returns List[ZoneArtifact]
-            
+            generators.append((zone, generator))
+
+        # Signing shells out to dnssec-keygen/dnssec-signzone per zone, and zones are
+        # independent, so sign them concurrently. Only the signing tools run on worker
+        # threads; all build filesystem access stays on this thread. Hooks run user
+        # scripts against the shared build config and plugin generators make no
+        # thread-safety promise, so those keep the serial path.
+        if enable_dnssec and not dnssec_hooks and not custom_generator_class and len(generators) > 1:
+            max_workers = min(len(generators), os.cpu_count() or 1)
+            logger.debug(f"Signing {len(generators)} zones for '{self.service_name}' with {max_workers} workers")
+            results = ZoneGenerator.generate_concurrently([generator for _, generator in generators], max_workers)
+        else:
+            results = (generator.generate() for _, generator in generators)
+
+        for (zone, _), artifacts in zip(generators, results):  # List[ZoneArtifact] per zone
             # Find the primary zone file for config generation
             primary_artifact = None
             
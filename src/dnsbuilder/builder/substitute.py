@@ -2,7 +2,8 @@
 import logging
 import re
 import os
-from typing import Dict, Any
+from collections import deque
+from typing import Dict, Any, FrozenSet
 from functools import wraps
 
 from ..abstractions import Image, InternalImage
@@ -12,6 +13,19 @@ from ..exceptions import BuildError, ReferenceNotFoundError
 
 logger = logging.getLogger(__name__)
 
+# Splits text into `${`, `{`, `}` and literal runs for single-pass expansion
+_TOKEN_RE = re.compile(r"(\$\{|[{}])")
+# Scalar types that never carry variables
+_LEAF_TYPES = frozenset((int, float, bool, type(None)))
+# os.environ is case-insensitive on Windows; its keys are stored upper-cased
+_ENV_UPPER = os.name == "nt"
+# Classifies the part after `services.` and extracts its fields in one match:
+# `<svc>.ip`, `<svc>.image.<prop>[...]`, or a malformed image reference
+_SERVICE_FIELD_RE = re.compile(
+    r"(?P<ip>.*)\.ip|(?P<svc>[^.]*)\.image\.(?P<prop>[^.]*)(?:\..*)?|(?P<bad>(?:.*\.)?image\..*)",
+    re.DOTALL,
+)
+
 def no_required(func):
     @wraps(func)
     def wrapper(self, key, *args, **kwargs):
@@ -61,6 +75,18 @@ class VariableSubstitutor:
         self.service_ips = service_ips
         self.reserved_ips = reserved_ips
         self.resolved_builds = resolved_builds
+        # Project-level variables are identical for every service
+        self._base_var_map = {
+            "project.name": config.name,
+            "project.inet": config.inet,
+        }
+        # Environment snapshot; variables changed mid-build are not observed
+        self._env = dict(os.environ)
+        # Placeholder keys (`${required}` -> `required`); built here rather than at
+        # import time since .dnsbattribute files may override constants.PLACEHOLDER
+        self._placeholder_keys = frozenset(
+            v[2:-1] for v in constants.PLACEHOLDER.values() if v.startswith("${") and v.endswith("}")
+        )
 
     def _norm(self, key: str) -> str:
         """Normalize key by applying alias mapping on dot-separated parts."""
@@ -90,12 +116,15 @@ class VariableSubstitutor:
         """
         logger.info("Substituting variables in configuration...")
         
-        # Build project-level variable map for config top-level fields
-        project_var_map = {
-            "project.name": self.config.name,
-            "project.inet": self.config.inet,
-        }
+        # Project-level variable map for config top-level fields
+        project_var_map = self._base_var_map
+        project_resolve = self._memoized(project_var_map)
         
+        # Bind hot methods once for the loops below
+        build_map = self._map
+        memoized = self._memoized
+        substitute = self._recursive
+
         # Process top-level extra fields
         result = {}
         for key, value in config_dict.items():
@@ -105,14 +134,14 @@ class VariableSubstitutor:
                 substituted_builds = {}
                 for service_name, service_conf in value.items():
                     # Build the variable map specific to this service
-                    var_map = self._map(service_name, service_conf)
+                    var_map = build_map(service_name, service_conf)
                     # Perform substitution on this service's config
-                    substituted_builds[service_name] = self._recursive(service_conf, var_map)
+                    substituted_builds[service_name] = substitute(service_conf, var_map, memoized(var_map))
                     logger.debug(f"Variable substitution complete for service '{service_name}'.")
                 result['builds'] = substituted_builds
             else:
                 # This is a top-level extra field, substitute with project-level variables
-                result[key] = self._recursive(value, project_var_map)
+                result[key] = substitute(value, project_var_map, project_resolve)
                 logger.debug(f"Variable substitution complete for config field '{key}'.")
         
         logger.info("All configuration variables substituted.")
@@ -120,21 +149,19 @@ class VariableSubstitutor:
 
     def _map(self, service_name: str, service_conf: Dict) -> Dict[str, str]:
         """Constructs the dictionary of available variables for a given service."""
-        var_map = {
-            # Service-level
-            "name": service_name,
-            "ip": self.service_ips.get(service_name, ""),
-            "rip": self.reserved_ips.get(service_name, ""),
-            "address": self.service_ips.get(service_name, ""),
-            # Project-level
-            "project.name": self.config.name,
-            "project.inet": self.config.inet,
-        }
+        # Project-level
+        var_map = self._base_var_map.copy()
+        # Service-level
+        ip = self.service_ips.get(service_name, "")
+        var_map["name"] = service_name
+        var_map["ip"] = ip
+        var_map["rip"] = self.reserved_ips.get(service_name, "")
+        var_map["address"] = ip
 
         # Image-level
         image_name = service_conf.get('image')
-        if image_name and image_name in self.images:
-            image_obj = self.images[image_name]
+        image_obj = self.images.get(image_name) if image_name else None
+        if image_obj is not None:
             var_map["image.name"] = image_obj.name
             if isinstance(image_obj, InternalImage):
                 if image_obj.software: 
@@ -144,13 +171,29 @@ class VariableSubstitutor:
             
         return var_map
 
+    def _memoized(self, var_map: Dict[str, str]):
+        """
+        Returns a `_resolve_variable` wrapper that caches results by key.
+        `var_map` is fixed for the whole service, so each key resolves to the same value.
+        """
+        cache: Dict[str, str] = {}
+        resolve_variable = self._resolve_variable
+
+        def resolve(key: str, var_map: Dict[str, str] = var_map) -> str:
+            value = cache.get(key)
+            if value is None:
+                value = cache[key] = resolve_variable(key, var_map)
+            return value
+
+        return resolve
+
     @lenient_resolver
     @no_required
     def _resolve_env(self, key: str) -> str:
         """Resolve environment variables with optional default values."""
         parts = key[4:].split(':', 1)  # Remove 'env.' prefix
         env_var_name = parts[0]
-        value = os.environ.get(env_var_name)
+        value = self._env.get(env_var_name.upper() if _ENV_UPPER else env_var_name)
         
         if value is not None:
             logger.debug(f"[Resolve/env] variable '${{{key}}}' -> '{value}' via env '{env_var_name}'.")
@@ -163,9 +206,8 @@ class VariableSubstitutor:
 
     @lenient_resolver
     @no_required
-    def _resolve_ip(self, key: str, fallback: str = None) -> str:
+    def _resolve_ip(self, key: str, service_to_find: str, fallback: str = None) -> str:
         """Resolve service IP addresses."""
-        service_to_find = key[9:-3]  # Remove 'services.' prefix and '.ip' suffix
         ip = self.service_ips.get(service_to_find)
         
         if ip:
@@ -180,15 +222,11 @@ class VariableSubstitutor:
 
     @lenient_resolver
     @no_required
-    def _resolve_img(self, key: str, fallback: str = None) -> str:
+    def _resolve_img(self, key: str, service_to_find: str = None, image_property: str = None, fallback: str = None) -> str:
         """Resolve service image properties using getattr."""
-        parts = key.split(".")
-        if len(parts) < 4 or parts[0] != "services" or parts[2] != "image":
+        if service_to_find is None:
             raise ReferenceNotFoundError(f"Invalid service image property format: '{key}'")
         
-        service_to_find = parts[1]
-        image_property = parts[3]
-        
         # Check if service exists in resolved builds
         if service_to_find not in self.resolved_builds:
             raise ReferenceNotFoundError(f"Cannot resolve image property for service '{service_to_find}': service not found in builds configuration.")
@@ -291,10 +329,19 @@ class VariableSubstitutor:
         logger.debug(f"[Resolve/build_conf] service '{service_name}', path '{'.'.join(path_parts)}' -> '{value}'.")
         return str(value)
 
+    def _resolve_service(self, key: str, rest: str, fallback: str = None) -> str:
+        """Resolves `services.<svc>.ip` and `services.<svc>.image.<prop>` keys; None otherwise."""
+        match = _SERVICE_FIELD_RE.fullmatch(rest)
+        if match is None:
+            return None
+        if match.lastgroup == "ip":
+            return self._resolve_ip(key, match["ip"], fallback=fallback)
+        return self._resolve_img(key, match["svc"], match["prop"], fallback=fallback)
+
     def _resolve_variable(self, key: str, var_map: Dict[str, str]) -> str:
         """Main variable resolution dispatcher."""
         # Skip placeholders
-        if f"${{{key}}}" in constants.PLACEHOLDER.values():
+        if key in self._placeholder_keys:
             return f"${{{key}}}"
 
         # Environment variables
@@ -310,13 +357,12 @@ class VariableSubstitutor:
         # Normalize aliases on core_key (dot-separated)
         core_key = self._norm(core_key)
 
-        # Service IP addresses
-        if core_key.startswith("services.") and core_key.endswith(".ip"):
-            return self._resolve_ip(core_key, fallback=fallback)
-
-        # Service image properties
-        if core_key.startswith("services.") and ".image." in core_key:
-            return self._resolve_img(core_key, fallback=fallback)
+        # Service IP addresses / service image properties
+        head, _, rest = core_key.partition(".")
+        if head == "services":
+            value = self._resolve_service(core_key, rest, fallback=fallback)
+            if value is not None:
+                return value
 
         # Local variables from var_map
         if core_key in var_map:
@@ -341,38 +387,85 @@ class VariableSubstitutor:
         logger.warning(f"Could not resolve variable '${{{core_key}}}' for service '{var_map.get('name', 'unknown')}'. Returning string 'none'.")
         return "none"
 
-    def _recursive(self, item: Any, var_map: Dict[str, str]) -> Any:
+    def _expand(self, text: str, var_map: Dict[str, str], active: FrozenSet[str] = frozenset(), resolve=None) -> str:
         """
-        Recursively substitutes variables.
+        Expands every `${...}` reference in a single left-to-right pass.
+
+        Nested references (`${services.${name}.ip}`) are resolved innermost first,
+        and a resolved value that itself contains references is expanded in place.
+        `active` holds the keys currently being expanded, so a reference cycle is
+        reported instead of looping.
         """
-        if isinstance(item, str):
-            # Nested placeholder-aware substitution: resolve innermost `${...}` first
-            substituted_string: Any = item
-
-            # Replace all innermost `${...}` occurrences in a single pass.
-            pattern = re.compile(r"\$\{([^{}]+)\}")
-
-            def expand_inner(text: str) -> str:
-                def _repl(m: re.Match) -> str:
-                    key = m.group(1)
-                    resolved = self._resolve_variable(key, var_map)
-                    logger.debug(f"[Substitute] Service '{var_map.get('name', 'unknown')}', variable '${{{key}}}' replaced with '{resolved}'.")
-                    return str(resolved)
-                return pattern.sub(_repl, text)
-
-            for _ in range(10):  # allow deeper nesting safely
-                new_string = expand_inner(substituted_string)
-                if new_string == substituted_string:
-                    break
-                substituted_string = new_string
+        if resolve is None:
+            resolve = self._resolve_variable
+        # Each frame: (opener, parts); opener is "" for the top level,
+        # "${" for a reference and "{" for a literal brace group.
+        stack = [("", [])]
+        for token in _TOKEN_RE.split(text):
+            if not token:
+                continue
+            if token == "${" or token == "{":
+                stack.append((token, []))
+            elif token == "}" and len(stack) > 1:
+                opener, parts = stack.pop()
+                content = "".join(parts)
+                if opener == "{":
+                    stack[-1][1].append("{" + content + "}")
+                elif not content or "{" in content or "}" in content:
+                    # empty or still-braced key (e.g. a kept placeholder): not a reference
+                    stack[-1][1].append("${" + content + "}")
+                else:
+                    stack[-1][1].append(self._expand_ref(content, var_map, active, resolve))
             else:
-                logger.warning(f"Possible circular or deeply nested variable reference in: {item}")
-
-            return substituted_string
-
-        elif isinstance(item, list):
-            return [self._recursive(sub_item, var_map) for sub_item in item]
-        elif isinstance(item, dict):
-            return {key: self._recursive(value, var_map) for key, value in item.items()}
-        else:
-            return item
\ No newline at end of file
+                stack[-1][1].append(token)
+
+        # Unterminated references are kept verbatim
+        while len(stack) > 1:
+            opener, parts = stack.pop()
+            stack[-1][1].append(opener + "".join(parts))
+        return "".join(stack[0][1])
+
+    def _expand_ref(self, key: str, var_map: Dict[str, str], active: FrozenSet[str], resolve) -> str:
+        """Resolves one reference and expands any references in its value."""
+        if key in active:
+            raise BuildError(f"Circular variable reference detected while resolving '${{{key}}}' for service '{var_map.get('name', 'unknown')}'.")
+        resolved = str(resolve(key, var_map))
+        logger.debug(f"[Substitute] Service '{var_map.get('name', 'unknown')}', variable '${{{key}}}' replaced with '{resolved}'.")
+        # placeholders resolve to themselves and must stay untouched
+        if "${" in resolved and resolved != f"${{{key}}}":
+            resolved = self._expand(resolved, var_map, active | {key}, resolve)
+        return resolved
+
+    def _recursive(self, item: Any, var_map: Dict[str, str], resolve=None) -> Any:
+        """
+        Substitutes variables in every string of a nested dict/list structure.
+        Walks the structure with an explicit queue instead of recursing per container;
+        containers are copied, the input is left untouched.
+        `resolve` optionally replaces `_resolve_variable`, e.g. with a memoized one.
+        """
+        expand = self._expand
+        # Each entry is (container, slot) whose value still has to be substituted
+        root = [item]
+        pending = deque([(root, 0)])
+        pop = pending.popleft
+        while pending:
+            target, slot = pop()
+            value = target[slot]
+            kind = type(value)
+            if kind in _LEAF_TYPES:
+                continue
+            if kind is not str and kind is not list and kind is not dict:
+                # Subclasses (e.g. str enums, OrderedDict) are handled like their base
+                # type; anything else, tuples included, is kept as-is
+                kind = next((base for base in (str, list, dict) if isinstance(value, base)), None)
+            if kind is str:
+                # Most config strings carry no reference at all
+                if "${" in value:
+                    target[slot] = expand(value, var_map, resolve=resolve)
+            elif kind is list:
+                target[slot] = copied = list(value)
+                pending.extend((copied, index) for index in range(len(copied)))
+            elif kind is dict:
+                target[slot] = copied = dict(value)
+                pending.extend((copied, key) for key in copied)
+        return root[0]
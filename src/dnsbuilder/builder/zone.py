@@ -1,4 +1,6 @@
 import time
+import io
+import os
 import subprocess
 import tempfile
 from pathlib import Path
@@ -6,18 +8,56 @@ from typing import List, Dict, Optional, Tuple, Any
 from dnslib import RR, SOA, A, NS, DNSLabel, QTYPE, CLASS
 import logging
 import hashlib
+import json
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 
 from ..datacls import BuildContext
 from ..datacls.artifacts import ZoneArtifact
 from ..exceptions import NetworkDefinitionError
-from ..io import DNSBPath
+from ..io import DNSBPath, DiskFileSystem
 from ..auto.executor import ScriptExecutor
-from ..utils.dnssec import get_dnssec_hooks, get_dnssec_includes
+from ..utils.dnssec import get_dnssec_hooks, get_dnssec_includes, get_signing_tmp_root, is_dnssec_key_reuse_enabled
 from ..utils.zone import ZoneName
 
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=4096)
+def _make_label(name: str) -> DNSLabel:
+    """Parses a domain name once; labels are shared read-only across zones."""
+    return DNSLabel(name)
+
+
+# Label bytes that dnslib renders verbatim (no escaping needed)
+_PLAIN_LABEL_BYTES = frozenset(b"abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789-_*")
+
+
+def _relative_name(labels: Tuple[bytes, ...]) -> str:
+    """Renders the labels left of the zone origin, joining plain labels without a DNSLabel."""
+    if all(label and _PLAIN_LABEL_BYTES.issuperset(label) for label in labels):
+        return ".".join([label.decode() for label in labels])
+    # fall back to dnslib for escaping of unusual bytes
+    return str(DNSLabel(labels)).rstrip('.')
+
+
+def _owner_only(path: str, flags: int) -> int:
+    """open() opener for files only their owner may read, such as cached private keys."""
+    fd = os.open(path, flags, 0o600)
+    # also tightens entries that already existed with wider permissions
+    os.fchmod(fd, 0o600)
+    return fd
+
+
+def _as_label(name: Any) -> DNSLabel:
+    """Returns `name` as a DNSLabel, reusing it if it already is one (as RR.rname is)."""
+    if isinstance(name, DNSLabel):
+        return name
+    if isinstance(name, bytes):
+        name = name.decode()
+    return _make_label(name)
+
+
 class ZoneGenerator:
     """
     Default BIND-style zone file generator.
@@ -44,6 +84,16 @@ class ZoneGenerator:
     # Default container path for zone files
     DEFAULT_ZONE_CONTAINER_PATH = "/usr/local/etc/zones"
 
+    # With dnssec.reuse_keys, generated keys are reused across builds until this old, then rolled over
+    KEY_CACHE_TTL = 30 * 24 * 3600
+    # The key cache must outlive the build, so it bypasses the build fs, which is an
+    # in-memory sandbox for incremental (CachedBuilder) and --vfs builds
+    _key_cache_fs = DiskFileSystem()
+    # Field names of a key set tuple (as returned by _find_keys_in_include()), in order
+    _KEY_FIELDS = (
+        "ksk_key", "ksk_private", "zsk_key", "zsk_private", "ksk_basename", "zsk_basename"
+    )
+
     def __init__(
         self,
         context: BuildContext,
@@ -78,16 +128,17 @@ class ZoneGenerator:
         self.build_conf = build_conf or {}
         self.dnssec_hooks = get_dnssec_hooks(self.build_conf) if enable_dnssec else {}
         self.dnssec_includes = get_dnssec_includes(self.build_conf) if enable_dnssec else []
+        self.reuse_keys = is_dnssec_key_reuse_enabled(self.build_conf) if enable_dnssec else False
         self._executor = ScriptExecutor(fs=context.fs) if self.dnssec_hooks else None
 
-    def _find_keys_in_include(self, temp_path: Path) -> Optional[Tuple[str, str, str, str, str, str]]:
+    def _find_keys_in_include(self) -> Optional[Tuple[str, str, str, str, str, str]]:
         """
         Try to find KSK/ZSK keys from include directories.
         Looks for files matching patterns:
         - *.ksk.key, *.ksk.private (KSK)
         - *.zsk.key, *.zsk.private (ZSK)
-        Args:
-            temp_path: Temporary directory to copy keys to
+        Returns:
+            (ksk_key, ksk_private, zsk_key, zsk_private, ksk_basename, zsk_basename) or None
         """
         fs = self.context.fs
 
@@ -191,11 +242,6 @@ class ZoneGenerator:
                     ksk_basename = ksk_key.name.replace('.key', '')
                     zsk_basename = zsk_key.name.replace('.key', '')
 
-                    (temp_path / f"{ksk_basename}.key").write_text(ksk_key_content)
-                    (temp_path / f"{ksk_basename}.private").write_text(ksk_private_content)
-                    (temp_path / f"{zsk_basename}.key").write_text(zsk_key_content)
-                    (temp_path / f"{zsk_basename}.private").write_text(zsk_private_content)
-
                     logger.info(f"[DNSSEC] Using keys from include directory: {key_dir}")
                     logger.info(f"[DNSSEC] KSK: {ksk_key.name}, ZSK: {zsk_key.name}")
 
@@ -248,60 +294,94 @@ class ZoneGenerator:
             logger.exception(e)
             raise
 
-    def _sign_zone(self) -> Optional[Tuple[str, str, str, str, str, str, str, str]]:
+    @staticmethod
+    def _communicate(proc: subprocess.Popen) -> str:
+        """Waits for a DNSSEC tool process and returns its stripped stdout, raising on failure."""
+        stdout, stderr = proc.communicate()
+        if proc.returncode:
+            raise subprocess.CalledProcessError(proc.returncode, proc.args, stdout, stderr)
+        # Only keygen's stdout (an ASCII key basename) is ever used; stderr is decoded on failure only
+        return stdout.decode("ascii").strip()
+
+    def _prepare_signing(self, unsigned_content: str) -> Optional[Tuple[str, Optional[Tuple[str, str, str, str, str, str]]]]:
         """
-        Sign the zone file. Reads unsigned content from temp:/services/.../db.<zone>.unsigned
-        and writes signed content back to temp:/services/.../db.<zone>
+        Does the build-filesystem work that comes before signing: writes the unsigned
+        zone to temp:/services/.../db.<zone>.unsigned, runs the pre hook and looks up
+        keys to sign with (include directories first, then keys from an earlier build).
+        The file is only read back when a pre hook ran, since the hook may rewrite it.
+
+        Returns:
+            (unsigned_content, keys) with keys None when they must be generated,
+            or None when the unsigned zone is gone after the pre hook
         """
-        unsigned_path = DNSBPath(f"temp:/services/{self.service_name}/zones/{self.zone.filename}.unsigned")
-        self._execute_hook('pre')
+        zones_dir = DNSBPath(f"temp:/services/{self.service_name}/zones")
+        self.context.fs.mkdir(zones_dir, parents=True, exist_ok=True)
+        unsigned_path = zones_dir / f"{self.zone.filename}.unsigned"
+        self.context.fs.write_text(unsigned_path, unsigned_content)
+        logger.debug(f"[DNSSEC] Wrote unsigned zone to {unsigned_path}")
 
-        # Read unsigned content
-        if not self.context.fs.exists(unsigned_path):
-            logger.error(f"[DNSSEC] Unsigned zone file not found: {unsigned_path}")
-            return None
-        unsigned_content = self.context.fs.read_text(unsigned_path)
-        logger.debug(f"[DNSSEC] Read unsigned zone from {unsigned_path}")
+        if self.dnssec_hooks.get('pre'):
+            self._execute_hook('pre')
+            if not self.context.fs.exists(unsigned_path):
+                logger.error(f"[DNSSEC] Unsigned zone file not found: {unsigned_path}")
+                return None
+            unsigned_content = self.context.fs.read_text(unsigned_path)
+            logger.debug(f"[DNSSEC] Read unsigned zone from {unsigned_path} after pre hook")
+
+        # Try to use keys from include directory first
+        keys = self._find_keys_in_include() if self.dnssec_includes else None
+        if keys:
+            logger.info(f"[DNSSEC] Using included keys for '{self.zone.fqdn}'")
+        else:
+            if self.dnssec_includes:
+                logger.warning(f"[DNSSEC] No valid keys found in include directories, falling back to auto-generation for '{self.zone.fqdn}'")
+            # Then the keys generated for this zone by an earlier build
+            keys = self._load_zone_keys()
+            if keys:
+                logger.debug(f"[DNSSEC] Reusing keys from an earlier build for '{self.zone.fqdn}'")
+        return unsigned_content, keys
+
+    def _sign_zone(
+        self,
+        unsigned_content: str,
+        keys: Optional[Tuple[str, str, str, str, str, str]] = None
+    ) -> Optional[Tuple[str, str, str, str, str, str, str, str]]:
+        """
+        Sign the zone with `keys`, or with keys generated by dnssec-keygen when None.
+        Works only in a private temp directory and never touches the build filesystem,
+        so several zones can be signed concurrently.
 
+        Returns:
+            (ksk_key, zsk_key, ds, ksk_private, zsk_private, ksk_basename, zsk_basename,
+            signed_content), or None when signing failed
+        """
         try:
-            with tempfile.TemporaryDirectory() as temp_dir:
+            with tempfile.TemporaryDirectory(dir=get_signing_tmp_root()) as temp_dir:
                 temp_path = Path(temp_dir)
 
                 unsigned_file = temp_path / self.zone.filename
                 unsigned_file.write_text(unsigned_content)
 
-                # Try to use keys from include directory first
-                included_keys = self._find_keys_in_include(temp_path)
-
-                if included_keys:
-                    # Use pre-generated keys from include directory
-                    ksk_key_content, ksk_private_content, zsk_key_content, zsk_private_content, ksk_basename, zsk_basename = included_keys
-                    logger.info(f"[DNSSEC] Using included keys for '{self.zone.fqdn}'")
+                if keys:
+                    ksk_key_content, ksk_private_content, zsk_key_content, zsk_private_content, ksk_basename, zsk_basename = keys
+                    # dnssec-signzone expects K<zone>.+<alg>+<keytag>.key/.private format
+                    (temp_path / f"{ksk_basename}.key").write_text(ksk_key_content)
+                    (temp_path / f"{ksk_basename}.private").write_text(ksk_private_content)
+                    (temp_path / f"{zsk_basename}.key").write_text(zsk_key_content)
+                    (temp_path / f"{zsk_basename}.private").write_text(zsk_private_content)
                 else:
-                    # Fallback: generate new keys
-                    if self.dnssec_includes:
-                        logger.warning(f"[DNSSEC] No valid keys found in include directories, falling back to auto-generation for '{self.zone.fqdn}'")
-
-                    logger.debug(f"Generating ZSK for '{self.zone.fqdn}' using dnssec-keygen")
-                    zsk_result = subprocess.run(
-                        ["dnssec-keygen", "-a", "ECDSAP256SHA256", "-n", "ZONE", self.zone.fqdn],
-                        cwd=temp_path,
-                        capture_output=True,
-                        text=True,
-                        check=True
-                    )
-                    zsk_basename = zsk_result.stdout.strip()
+                    # No keys to reuse: generate new ones
+                    # ZSK and KSK are independent: run both dnssec-keygen processes concurrently
+                    logger.debug(f"Generating ZSK and KSK for '{self.zone.fqdn}' using dnssec-keygen")
+                    keygen = dict(cwd=temp_path, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+                    with subprocess.Popen(
+                        ["dnssec-keygen", "-a", "ECDSAP256SHA256", "-n", "ZONE", self.zone.fqdn], **keygen
+                    ) as zsk_proc, subprocess.Popen(
+                        ["dnssec-keygen", "-a", "ECDSAP256SHA256", "-f", "KSK", "-n", "ZONE", self.zone.fqdn], **keygen
+                    ) as ksk_proc:
+                        zsk_basename = self._communicate(zsk_proc)
+                        ksk_basename = self._communicate(ksk_proc)
                     logger.debug(f"Generated ZSK: {zsk_basename}")
-
-                    logger.debug(f"Generating KSK for '{self.zone.fqdn}' using dnssec-keygen")
-                    ksk_result = subprocess.run(
-                        ["dnssec-keygen", "-a", "ECDSAP256SHA256", "-f", "KSK", "-n", "ZONE", self.zone.fqdn],
-                        cwd=temp_path,
-                        capture_output=True,
-                        text=True,
-                        check=True
-                    )
-                    ksk_basename = ksk_result.stdout.strip()
                     logger.debug(f"Generated KSK: {ksk_basename}")
 
                     zsk_key_file = temp_path / f"{zsk_basename}.key"
@@ -322,34 +402,32 @@ class ZoneGenerator:
                     ksk_private_content = ksk_private_file.read_text()
 
                 # append keys
-                unsigned_file.write_text(
-                    unsigned_file.read_text() + "\n" +
-                    f"$INCLUDE {zsk_basename}.key\n" +
-                    f"$INCLUDE {ksk_basename}.key\n"
-                )
+                with unsigned_file.open("a") as f:
+                    f.write(f"\n$INCLUDE {zsk_basename}.key\n$INCLUDE {ksk_basename}.key\n")
 
                 logger.debug(f"Signing zone '{self.zone.fqdn}' using dnssec-signzone")
                 sign_result = subprocess.run(
                     [
                         "dnssec-signzone",
-                        "-3", hashlib.sha1(self.zone.fqdn.encode()).hexdigest()[:16],
+                        "-3", hashlib.blake2b(self.zone.fqdn.encode(), digest_size=8).hexdigest(),
                         "-N", "INCREMENT",
                         "-o", self.zone.fqdn,
                         str(unsigned_file),
                     ],
                     cwd=temp_path,
                     capture_output=True,
-                    text=True,
                     check=True
                 )
 
-                logger.debug(f"dnssec-signzone output: {sign_result.stdout}")
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(f"dnssec-signzone output: {sign_result.stdout.decode(errors='replace')}")
                 signed_file = temp_path / f"{self.zone.filename}.signed"
                 if not signed_file.exists():
                     logger.error(f"Signed zone file not found: {signed_file}")
                     return None
 
-                signed_content = signed_file.read_text()
+                # One raw read sized from the file, decoded once (signzone emits plain '\n' lines)
+                signed_content = signed_file.read_bytes().decode()
 
                 # DS records are only for child zones (root has no parent)
                 ds_content = ""
@@ -365,17 +443,12 @@ class ZoneGenerator:
 
                 logger.debug(f"DNSSEC signing succeeded for '{self.zone.fqdn}'")
 
-                # Write signed zone to temp:/services/ for post hook and final output
-                zones_dir = DNSBPath(f"temp:/services/{self.service_name}/zones")
-                signed_path = zones_dir / self.zone.filename
-                self.context.fs.write_text(signed_path, signed_content)
-                logger.debug(f"[DNSSEC] Wrote signed zone to {signed_path}")
-
                 return (ksk_key_content, zsk_key_content, ds_content,
-                        ksk_private_content, zsk_private_content, ksk_basename, zsk_basename)
+                        ksk_private_content, zsk_private_content, ksk_basename, zsk_basename,
+                        signed_content)
 
         except subprocess.CalledProcessError as e:
-            logger.error(f"DNSSEC command failed for '{self.zone.fqdn}': {e.stderr}")
+            logger.error(f"DNSSEC command failed for '{self.zone.fqdn}': {e.stderr.decode(errors='replace')}")
             return None
         except FileNotFoundError as e:
             logger.error(f"DNSSEC tools not found. Please install bind9-dnsutils: {e}")
@@ -385,6 +458,58 @@ class ZoneGenerator:
             logger.exception(e)
             return None
 
+    def _zone_keys_path(self) -> Optional[DNSBPath]:
+        """
+        On-disk cache entry path for the keys generated for this zone, keyed by service and zone.
+        Returns None unless dnssec.reuse_keys is set, and with hooks (they may expect
+        freshly generated keys).
+        """
+        cache_root = getattr(self.context.fs, "cache_root", None)
+        if not self.reuse_keys or cache_root is None or self.dnssec_hooks:
+            return None
+        digest = hashlib.sha256(json.dumps(["v1", self.service_name, self.zone.fqdn]).encode()).hexdigest()
+        if not isinstance(cache_root, DNSBPath):
+            cache_root = DNSBPath(cache_root)
+        chroot = getattr(self.context.fs, "chroot", None)
+        if not cache_root.is_absolute() and chroot is not None and chroot.is_disk():
+            # where the build fs would resolve it
+            cache_root = chroot / cache_root
+        return self._key_cache_fs.absolute(cache_root / "keys" / f"{digest}.json")
+
+    def _load_zone_keys(self) -> Optional[Tuple[str, str, str, str, str, str]]:
+        """Loads the keys an earlier build generated for this zone, unless due for rollover."""
+        keys_path = self._zone_keys_path()
+        if keys_path is None:
+            return None
+        fs = self._key_cache_fs
+        try:
+            if not fs.exists(keys_path):
+                return None
+            entry = json.loads(fs.read_text(keys_path))
+            if time.time() - entry["created_at"] > self.KEY_CACHE_TTL:
+                logger.debug(f"[DNSSEC] Cached keys for '{self.zone.fqdn}' are due for rollover")
+                return None
+            return tuple(entry[field] for field in self._KEY_FIELDS)
+        except Exception as e:
+            logger.debug(f"[DNSSEC] Ignoring unreadable key cache {keys_path}: {e}")
+            return None
+
+    def _store_zone_keys(self, keys: Tuple[str, str, str, str, str, str]) -> None:
+        """Stores freshly generated keys so later builds can skip dnssec-keygen; the entry is owner-only (0600)."""
+        keys_path = self._zone_keys_path()
+        if keys_path is None:
+            return
+        fs = self._key_cache_fs
+        entry = dict(zip(self._KEY_FIELDS, keys))
+        entry["created_at"] = time.time()
+        try:
+            fs.mkdir(keys_path.parent, parents=True, exist_ok=True)
+            with fs.open(keys_path, "w", opener=_owner_only) as f:
+                f.write(json.dumps(entry))
+            logger.debug(f"[DNSSEC] Cached keys for '{self.zone.fqdn}' at {keys_path}")
+        except Exception as e:
+            logger.warning(f"[DNSSEC] Failed to cache keys for '{self.zone.fqdn}': {e}")
+
     def generate(self) -> List[ZoneArtifact]:
         """
         Creates the full zone file content, including SOA and NS records.
@@ -392,12 +517,59 @@ class ZoneGenerator:
         Returns:
             List[ZoneArtifact]: List of generated zone file artifacts.
         """
+        unsigned_content = self._render_zone()
+        if not self.enable_dnssec:
+            return self._unsigned_artifacts(unsigned_content)
+
+        prepared = self._prepare_signing(unsigned_content)
+        sign_result = self._sign_zone(*prepared) if prepared else None
+        return self._signed_artifacts(unsigned_content, prepared, sign_result)
+
+    @staticmethod
+    def generate_concurrently(generators: List["ZoneGenerator"], max_workers: int) -> List[List[ZoneArtifact]]:
+        """
+        Generates several DNSSEC-enabled zones, signing up to `max_workers` of them at once.
+
+        Only _sign_zone() (dnssec-keygen/dnssec-signzone in a private temp directory)
+        runs on the worker threads. Rendering, hooks, key lookups and every write to
+        the shared build filesystem stay on the calling thread.
+
+        Returns:
+            The artifacts of each generator, in order.
+        """
+        unsigned = [generator._render_zone() for generator in generators]
+        prepared = [generator._prepare_signing(content) for generator, content in zip(generators, unsigned)]
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            sign_results = list(executor.map(
+                lambda generator, prep: generator._sign_zone(*prep) if prep else None,
+                generators, prepared
+            ))
+        return [
+            generator._signed_artifacts(content, prep, sign_result)
+            for generator, content, prep, sign_result in zip(generators, unsigned, prepared, sign_results)
+        ]
+
+    def _unsigned_artifacts(self, unsigned_content: str) -> List[ZoneArtifact]:
+        """The unsigned zone as the only, primary artifact."""
+        return [
+            ZoneArtifact(
+                filename=self.zone.filename,
+                content=unsigned_content,
+                container_path=f"{self.DEFAULT_ZONE_CONTAINER_PATH}/{self.zone.filename}",
+                is_primary=True
+            )
+        ]
+
+    def _render_zone(self) -> str:
+        """Renders the unsigned zone file text: default SOA/NS/A records followed by the user records."""
+        fqdn = self.zone.fqdn
+
         logger.debug(
-            f"Generating zone file for '{self.zone.fqdn}' with {len(self.records)} records (DNSSEC: {self.enable_dnssec})."
+            f"Generating zone file for '{fqdn}' with {len(self.records)} records (DNSSEC: {self.enable_dnssec})."
         )
 
-        # Generate a simple serial number based on the current timestamp
-        serial = int(time.time())
+        # Serial is the build's timestamp, shared by all zones of this build
+        serial = self.context.build_serial
 
         # Create default SOA and NS records using service name
         # Format: {service}.servers.net. (e.g., root.servers.net., tld.servers.net.)
@@ -406,7 +578,7 @@ class ZoneGenerator:
 
         default_records = [
             RR(
-                rname=self.zone.fqdn,
+                rname=fqdn,
                 rtype=QTYPE.SOA,
                 rdata=SOA(
                     mname=ns_name,  # Primary master name
@@ -422,7 +594,7 @@ class ZoneGenerator:
                 ttl=86400,
             ),
             RR(
-                rname=self.zone.fqdn,
+                rname=fqdn,
                 rtype=QTYPE.NS,
                 rdata=NS(ns_name),
                 ttl=3600,
@@ -437,110 +609,135 @@ class ZoneGenerator:
 
         # Add all user-defined records
         all_records = default_records + self.records
-
-        # Format all records into a zone file string
-        zone_content_parts = [f"$ORIGIN {self.zone.fqdn}"]
-        zone_label = DNSLabel(self.zone.fqdn)
-
-        # First pass: calculate the maximum domain name length
+        rdata_texts = [record.rdata.toZone() for record in all_records]
+
+        # Format all records into a zone file buffer
+        buf = io.StringIO()
+        write = buf.write
+        write(f"$ORIGIN {fqdn}")
+        zone_label = _make_label(fqdn)
+
+        # Suffix checks compare label tuples instead of rendered names
+        zone_tuple = zone_label.label
+        zone_len = len(zone_tuple)
+        # Class/type mnemonics are resolved once per distinct value in this zone
+        class_get = CLASS.get
+        qtype_get = QTYPE.get
+        class_names: Dict[int, str] = {}
+        type_names: Dict[int, str] = {}
+
+        # First pass: owner names only, to size the name column
         max_rname_len = 0
-        formatted_records = []
+        rname_strs = []
+        # Records share few owner names; render each distinct one once.
+        # Keyed on the raw label bytes, since DNSLabel compares case-insensitively.
+        owner_names: Dict[Tuple[bytes, ...], str] = {}
 
         for record in all_records:
-            record_label = DNSLabel(record.rname)
-            rname_str = ""
-
-            if record_label == zone_label:
-                rname_str = "@"
-            elif str(record_label).endswith(str(zone_label)):
-                relative_label_obj = record_label.stripSuffix(zone_label)
-                rname_str = str(relative_label_obj).rstrip('.')
-            else:
-                rname_str = str(record_label)
-
-            max_rname_len = max(max_rname_len, len(rname_str))
-
-            ttl_str = str(record.ttl) if record.ttl else ""
-            rclass_str = CLASS.get(record.rclass, f"CLASS{record.rclass}")
-            rtype_str = QTYPE.get(record.rtype, f"TYPE{record.rtype}")
+            record_label = _as_label(record.rname)
+            record_tuple = record_label.label
+            rname_str = owner_names.get(record_tuple)
+            if rname_str is None:
+                cut = len(record_tuple) - zone_len
+                if record_label == zone_label:
+                    rname_str = "@"
+                elif cut > 0 and record_tuple[cut:] == zone_tuple:
+                    rname_str = _relative_name(record_tuple[:cut])
+                else:
+                    rname_str = str(record_label)
+                owner_names[record_tuple] = rname_str
 
-            formatted_records.append((rname_str, ttl_str, rclass_str, rtype_str, record.rdata.toZone()))
+            if len(rname_str) > max_rname_len:
+                max_rname_len = len(rname_str)
+            rname_strs.append(rname_str)
 
         # Use dynamic width based on the longest domain name, minimum 24
         rname_width = max(24, max_rname_len + 4)
 
-        # Second pass: format all records with consistent width
-        for rname_str, ttl_str, rclass_str, rtype_str, rdata in formatted_records:
-            line = f"{rname_str:<{rname_width}}{ttl_str:<8}{rclass_str:<8}{rtype_str:<8}{rdata}"
-            zone_content_parts.append(line)
-
-        unsigned_content = "\n".join(zone_content_parts)
-        logger.debug(f"Finished generating unsigned zone file for '{self.zone.fqdn}'.")
-
-        if not self.enable_dnssec:
-            return [
-                ZoneArtifact(
-                    filename=self.zone.filename,
-                    content=unsigned_content,
-                    container_path=f"/usr/local/etc/zones/{self.zone.filename}",
-                    is_primary=True
-                )
-            ]
-
-        # Write unsigned zone file to temp:/services/ before signing, easy to modify
-        zones_dir = DNSBPath(f"temp:/services/{self.service_name}/zones")
-        self.context.fs.mkdir(zones_dir, parents=True, exist_ok=True)
-        unsigned_path = zones_dir / f"{self.zone.filename}.unsigned"
-        self.context.fs.write_text(unsigned_path, unsigned_content)
-        logger.debug(f"[DNSSEC] Wrote unsigned zone to {unsigned_path}")
+        # Second pass: format each record and write it straight into the buffer
+        for record, rname_str, rdata_text in zip(all_records, rname_strs, rdata_texts):
+            ttl_str = str(record.ttl) if record.ttl else ""
+            rclass = record.rclass
+            rclass_str = class_names.get(rclass)
+            if rclass_str is None:
+                rclass_str = class_names[rclass] = class_get(rclass, f"CLASS{rclass}")
+            rtype = record.rtype
+            rtype_str = type_names.get(rtype)
+            if rtype_str is None:
+                rtype_str = type_names[rtype] = qtype_get(rtype, f"TYPE{rtype}")
+            write("\n")
+            write(rname_str.ljust(rname_width))
+            write(ttl_str.ljust(8))
+            write(rclass_str.ljust(8))
+            write(rtype_str.ljust(8))
+            write(rdata_text)
+
+        unsigned_content = buf.getvalue()
+        logger.debug(f"Finished generating unsigned zone file for '{fqdn}'.")
+        return unsigned_content
+
+    def _signed_artifacts(
+        self,
+        unsigned_content: str,
+        prepared: Optional[Tuple[str, Optional[Tuple[str, str, str, str, str, str]]]],
+        sign_result: Optional[Tuple[str, str, str, str, str, str, str, str]]
+    ) -> List[ZoneArtifact]:
+        """
+        Does the build-filesystem work that comes after signing: stores newly generated
+        keys, writes the signed zone to temp:/services and the key material to key:/.
+        Falls back to the unsigned zone when signing failed.
+        """
+        fqdn = self.zone.fqdn
+        filename = self.zone.filename
+        container_path = f"{self.DEFAULT_ZONE_CONTAINER_PATH}/{filename}"
 
-        # Sign the zone (reads from temp:/services, pre hook can modify the file)
-        sign_result = self._sign_zone()
         if not sign_result:
-            logger.warning(f"DNSSEC signing failed for '{self.zone.fqdn}', falling back to unsigned.")
-            return [
-                ZoneArtifact(
-                    filename=self.zone.filename,
-                    content=unsigned_content,
-                    container_path=f"/usr/local/etc/zones/{self.zone.filename}",
-                    is_primary=True
-                )
-            ]
-
-        # Read signed zone from temp:/services/
-        signed_path = zones_dir / self.zone.filename
-        signed_content = self.context.fs.read_text(signed_path)
-        unsigned_content = self.context.fs.read_text(unsigned_path)
-
-        ksk_content, zsk_content, ds_content, ksk_private_content, zsk_private_content, ksk_basename, zsk_basename = sign_result
-        logger.debug(f"DNSSEC signing successful for '{self.zone.fqdn}', generating artifacts.")
+            logger.warning(f"DNSSEC signing failed for '{fqdn}', falling back to unsigned.")
+            return self._unsigned_artifacts(unsigned_content)
+
+        # The pre hook may have rewritten the unsigned zone
+        unsigned_content, keys = prepared
+        (ksk_content, zsk_content, ds_content, ksk_private_content, zsk_private_content,
+         ksk_basename, zsk_basename, signed_content) = sign_result
+        if keys is None:
+            self._store_zone_keys((ksk_content, ksk_private_content, zsk_content,
+                                   zsk_private_content, ksk_basename, zsk_basename))
+
+        # Write signed zone to temp:/services/ for post hook and final output
+        signed_path = DNSBPath(f"temp:/services/{self.service_name}/zones/{filename}")
+        self.context.fs.write_text(signed_path, signed_content)
+        logger.debug(f"[DNSSEC] Wrote signed zone to {signed_path}")
+        logger.debug(f"DNSSEC signing successful for '{fqdn}', generating artifacts.")
 
         artifacts = [
             # Signed zone file
             ZoneArtifact(
-                filename=self.zone.filename,
+                filename=filename,
                 content=signed_content,
-                container_path=f"/usr/local/etc/zones/{self.zone.filename}",
+                container_path=container_path,
                 is_primary=True
             ),
             ZoneArtifact(
-                filename=f"{self.zone.filename}.unsigned",
+                filename=f"{filename}.unsigned",
                 content=unsigned_content,
-                container_path=f"/usr/local/etc/zones/{self.zone.filename}.unsigned",
+                container_path=f"{container_path}.unsigned",
                 is_primary=False
             )
         ]
         # Store keys in key:/ filesystem for DNSSEC re-signing
         # These are NOT mounted to containers - signed zone already contains all DNSSEC records
-        self.context.fs.mkdir(DNSBPath(f"key:/{self.service_name}"), exist_ok=True)
-        self.context.fs.write_text(DNSBPath(f"key:/{self.service_name}/{self.zone.label}.ksk.key"), ksk_content)
-        self.context.fs.write_text(DNSBPath(f"key:/{self.service_name}/{self.zone.label}.ksk.private"), ksk_private_content)
-        self.context.fs.write_text(DNSBPath(f"key:/{self.service_name}/{self.zone.label}.zsk.key"), zsk_content)
-        self.context.fs.write_text(DNSBPath(f"key:/{self.service_name}/{self.zone.label}.zsk.private"), zsk_private_content)
-        self.context.fs.write_text(DNSBPath(f"key:/{self.service_name}/{self.zone.label}.ds"), ds_content)
+        key_prefix = f"key:/{self.service_name}/{self.zone.label}"
         # Save key basenames for re-signing (e.g., "K.+013+61193")
         # This metadata is needed to recreate proper key filenames during re-signing
         key_metadata = f"KSK_BASENAME={ksk_basename}\nZSK_BASENAME={zsk_basename}\n"
-        self.context.fs.write_text(DNSBPath(f"key:/{self.service_name}/{self.zone.label}.keynames"), key_metadata)
+        # One batch: the key:/{service} directory is created once for all six files
+        self.context.fs.write_many([
+            (DNSBPath(f"{key_prefix}.ksk.key"), ksk_content),
+            (DNSBPath(f"{key_prefix}.ksk.private"), ksk_private_content),
+            (DNSBPath(f"{key_prefix}.zsk.key"), zsk_content),
+            (DNSBPath(f"{key_prefix}.zsk.private"), zsk_private_content),
+            (DNSBPath(f"{key_prefix}.ds"), ds_content),
+            (DNSBPath(f"{key_prefix}.keynames"), key_metadata),
+        ])
 
         return artifacts
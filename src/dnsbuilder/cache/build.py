@@ -4,7 +4,7 @@ import asyncio
 
 from ..builder import Builder
 from .manager import CacheManager
-from .view import ProjectCacheView, ServiceCacheView
+from .view import ProjectCacheView, ServiceCacheView, stat_mtime_ns
 from .. import constants
 from ..datacls import BuildContext
 from ..config import Config
@@ -250,6 +250,10 @@ class CachedBuilder(Builder):
         for service_name in changes['services_to_update']:
             self._sync_service(service_name, memory_output_dir)
         
+        # untouched services keep the output mtimes recorded by the previous sync
+        for service_name in self.memory_project_cache.services.keys() - changes['services_to_update']:
+            self._carry_synced_mtimes(service_name)
+        
         self._sync_shared_images(memory_output_dir)
         
         # sync docker-compose file (if changed)
@@ -258,6 +262,16 @@ class CachedBuilder(Builder):
         
         logger.info("Changes synced to disk successfully")
     
+    def _carry_synced_mtimes(self, service_name: str):
+        """copy output mtimes of a service that is not re-synced from the existing cache"""
+        existing_service_cache = self.project_cache.get_service(service_name) if self.project_cache else None
+        if not existing_service_cache:
+            return
+        for rel_file_path, memory_file_cache in self.memory_project_cache.get_service(service_name).files.items():
+            existing_file_cache = existing_service_cache.files.get(rel_file_path)
+            if existing_file_cache:
+                memory_file_cache.synced_mtime_ns = existing_file_cache.synced_mtime_ns
+    
     def _sync_service(self, service_name: str, memory_output_dir: DNSBPath):
         """update service to disk using FileCacheView"""
         logger.debug(f"Syncing service '{service_name}' to disk using FileCacheView...")
@@ -301,6 +315,7 @@ class CachedBuilder(Builder):
                 if (memory_file_cache.get_update_hash() == existing_file_cache.get_update_hash() and
                     self.real_fs.exists(real_file_path)):
                     needs_sync = False
+                    memory_file_cache.synced_mtime_ns = existing_file_cache.synced_mtime_ns
                     files_skipped += 1
             
             if needs_sync:
@@ -313,6 +328,7 @@ class CachedBuilder(Builder):
                 if self.memory_fs.exists(memory_file_path):
                     file_content = self.memory_fs.read_bytes(memory_file_path)
                     self.real_fs.write_bytes(real_file_path, file_content)
+                    memory_file_cache.synced_mtime_ns = stat_mtime_ns(self.real_fs.stat(real_file_path))
                     files_synced += 1
                     logger.debug(f"Synced file: {rel_file_path}")
                 else:
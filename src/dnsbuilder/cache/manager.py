@@ -1,11 +1,12 @@
-import json
-import hashlib
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Optional, Any
-from datetime import datetime
-from pydantic.networks import IPv4Network
+from pydantic_core import to_json
 
-from .view import ProjectCacheView, ServiceCacheView, FileCacheView
+from .view import (
+    ProjectCacheView, ServiceCacheView, FileCacheView,
+    CONTENT_HASH_ALGORITHM, MAX_HASH_WORKERS, hash_content, stat_mtime_ns,
+)
 from ..io import DNSBPath, FileSystem
 
 logger = logging.getLogger(__name__)
@@ -48,12 +49,10 @@ class CacheManager:
         """
         try:
             cache_path = self._get_project_cache_path(project_cache.name)
-            cache_data = project_cache.model_dump(by_alias=True, exclude_none=True)
+            # Serialize straight to UTF-8 bytes, skipping the intermediate str and its encoded copy
+            cache_json = to_json(project_cache, by_alias=True, exclude_none=True, indent=2)
             
-            # serialize datetime objects
-            cache_data = self._serialize_datetime(cache_data)
-            
-            self.fs.write_text(cache_path, json.dumps(cache_data, indent=2, ensure_ascii=False))
+            self.fs.write_bytes(cache_path, cache_json)
             logger.info(f"Saved project cache for '{project_cache.name}' to {cache_path}")
             return True
             
@@ -78,12 +77,15 @@ class CacheManager:
                 logger.debug(f"No cache file found for project '{project_name}'")
                 return None
             
-            cache_data = json.loads(self.fs.read_text(cache_path))
+            project_cache = ProjectCacheView.model_validate_json(self.fs.read_text(cache_path))
             
-            # deserialize datetime objects
-            cache_data = self._deserialize_datetime(cache_data)
+            # Caches written before hash_algorithm was recorded hold SHA-256 hashes
+            algorithm = project_cache.hash_algorithm if "hash_algorithm" in project_cache.model_fields_set else "sha256"
+            if algorithm != CONTENT_HASH_ALGORITHM:
+                logger.info(f"Discarding cache for '{project_name}': hashed with {algorithm}, now using {CONTENT_HASH_ALGORITHM}")
+                return None
             
-            return ProjectCacheView(**cache_data)
+            return project_cache
             
         except Exception as e:
             logger.error(f"Failed to load project cache for '{project_name}': {e}")
@@ -170,36 +172,63 @@ class CacheManager:
             if not self.fs.exists(service_dir):
                 return False
             
-            # Check each file consistency
-            for file_path, file_cache in service_cache.files.items():
-                full_file_path = service_dir / file_path
-                
-                if not self.fs.exists(full_file_path):
-                    logger.debug(f"File missing: {full_file_path}")
-                    return False
-                
-                # Check file consistency hash
-                try:
-                    current_file_cache = FileCacheView.from_file_path(full_file_path, self.fs)
-                    # Set relative path for consistent comparison
-                    current_file_cache.set_rel_path(file_path)
-
-                    if current_file_cache.get_consistency_hash() != file_cache.get_consistency_hash():
-                        logger.debug(f"File consistency hash mismatch: {full_file_path}")
-                        return False
-                except Exception as e:
-                    logger.debug(f"Error checking file {full_file_path}: {e}")
-                    return False
-            
-            return True
+            # Check each file consistency, rehashing files in parallel
+            items = list(service_cache.files.items())
+            if len(items) <= 1:
+                return all(self._check_file_consistency(service_dir, *item) for item in items)
+            executor = ThreadPoolExecutor(max_workers=min(MAX_HASH_WORKERS, len(items)))
+            try:
+                return all(executor.map(lambda item: self._check_file_consistency(service_dir, *item), items))
+            finally:
+                # Stop at the first inconsistent file
+                executor.shutdown(cancel_futures=True)
             
         except Exception as e:
             logger.error(f"Error during service consistency check: {e}")
             return False
     
+    def _check_file_consistency(self, service_dir: DNSBPath, file_path: str, file_cache: FileCacheView) -> bool:
+        """
+        Check one cached file against its copy in the service directory
+        
+        Args:
+            service_dir: Service directory path
+            file_path: File path relative to the service directory
+            file_cache: Cached file view
+            
+        Returns:
+            bool: Whether consistent
+        """
+        full_file_path = service_dir / file_path
+        
+        if not self.fs.exists(full_file_path):
+            logger.debug(f"File missing: {full_file_path}")
+            return False
+        
+        # Check file consistency hash
+        try:
+            # Unchanged size and mtime since the last sync: skip rehashing
+            if file_cache.synced_mtime_ns is not None:
+                stat = self.fs.stat(full_file_path)
+                if stat.st_size == file_cache.size and stat_mtime_ns(stat) == file_cache.synced_mtime_ns:
+                    return True
+            
+            current_file_cache = FileCacheView.from_file_path(full_file_path, self.fs)
+            # Set relative path for consistent comparison
+            current_file_cache.set_rel_path(file_path)
+
+            if current_file_cache.get_consistency_hash() != file_cache.get_consistency_hash():
+                logger.debug(f"File consistency hash mismatch: {full_file_path}")
+                return False
+        except Exception as e:
+            logger.debug(f"Error checking file {full_file_path}: {e}")
+            return False
+        
+        return True
+    
     def _calculate_file_hash(self, file_path: DNSBPath) -> str:
         """
-        Calculate SHA256 hash of a file
+        Calculate content hash of a file
         
         Args:
             file_path: File path
@@ -208,43 +237,11 @@ class CacheManager:
             str: File hash
         """
         try:
-            content = self.fs.read_bytes(file_path)
-            return hashlib.sha256(content).hexdigest()
+            return hash_content(file_path, self.fs)
         except Exception as e:
             logger.error(f"Error calculating file hash for {file_path}: {e}")
             return ""
     
-    def _serialize_datetime(self, data: Any) -> Any:
-        """Recursively serialize datetime and IPv4Network objects to strings"""
-        if isinstance(data, datetime):
-            return data.isoformat()
-        elif isinstance(data, IPv4Network):
-            return str(data)
-        elif isinstance(data, dict):
-            return {k: self._serialize_datetime(v) for k, v in data.items()}
-        elif isinstance(data, list):
-            return [self._serialize_datetime(item) for item in data]
-        else:
-            return data
-    
-    def _deserialize_datetime(self, data: Any) -> Any:
-        """Recursively deserialize strings to datetime objects"""
-        if isinstance(data, dict):
-            result = {}
-            for k, v in data.items():
-                if k in ['created_at', 'updated_at'] and isinstance(v, str):
-                    try:
-                        result[k] = datetime.fromisoformat(v)
-                    except ValueError:
-                        result[k] = datetime.now()
-                else:
-                    result[k] = self._deserialize_datetime(v)
-            return result
-        elif isinstance(data, list):
-            return [self._deserialize_datetime(item) for item in data]
-        else:
-            return data
-    
     def list_cached_projects(self) -> List[str]:
         """
         List all cached projects
@@ -1,14 +1,25 @@
 import hashlib
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Dict, List, Optional, Any
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Any, Tuple
 import fnmatch
+import os
+import re
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr, ValidationError, field_serializer, field_validator
+from pydantic.networks import IPv4Network
 from ..io import DNSBPath, FileSystem
 from ..exceptions import DNSBPathNotFoundError, DNSBNotADirectoryError
 import logging
 
+try:
+    import xxhash
+except ImportError:
+    # If xxhash is not installed, content hashes fall back to SHA-256
+    xxhash = None
+
 logger = logging.getLogger(__name__)
 
 # exclude all file level difference
@@ -65,6 +76,81 @@ DEFAULT_IGNORE_PATTERNS = [
 ]
 
 
+def _match_ignore(path: str, compiled: Tuple[Optional["re.Pattern"], Optional["re.Pattern"]]) -> bool:
+    """Match a relative path against a pair from _compile_ignore_patterns"""
+    normalized_re, raw_re = compiled
+    if normalized_re is None:
+        return False
+    # Same as fnmatch-ing every pattern against both the normalized and the raw path
+    normalized_path = path.replace('\\', '/')
+    if normalized_re.match(os.path.normcase(normalized_path)):
+        return True
+    if raw_re is normalized_re and normalized_path == path:
+        return False
+    return raw_re.match(os.path.normcase(path)) is not None
+
+
+# Content hashes only detect changes, so prefer non-cryptographic xxh3 when it is available
+CONTENT_HASH_ALGORITHM = "xxh3_128" if xxhash is not None else "sha256"
+
+
+def hash_content(path: DNSBPath, fs: FileSystem) -> str:
+    """Hex content hash of a file with CONTENT_HASH_ALGORITHM"""
+    return fs.hash_file(path, xxhash.xxh3_128 if xxhash is not None else "sha256")
+
+
+def stat_mtime_ns(stat: os.stat_result) -> int:
+    """Modification time in nanoseconds, also for stat results built without st_mtime_ns"""
+    if stat.st_mtime_ns is not None:
+        return stat.st_mtime_ns
+    return int(stat.st_mtime * 1e9)
+
+
+# File hashing releases the GIL (reads and hashlib), so scans hash files on a thread pool
+MAX_HASH_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+
+def _compile_glob_alternation(patterns) -> Optional["re.Pattern"]:
+    """One anchored regex matching any of `patterns` (fnmatch semantics), or None if empty."""
+    unique = dict.fromkeys(os.path.normcase(p) for p in patterns)
+    if not unique:
+        return None
+    return re.compile("|".join(f"(?:{fnmatch.translate(p)})" for p in unique))
+
+
+@lru_cache(maxsize=32)
+def _compile_ignore_patterns(patterns: Tuple[str, ...]) -> Tuple[Optional["re.Pattern"], Optional["re.Pattern"]]:
+    """
+    Compile ignore patterns once per pattern set: a regex of the '/'-normalized patterns
+    and one of the raw patterns (the same object when no pattern contains a backslash).
+    """
+    normalized = _compile_glob_alternation(p.replace('\\', '/') for p in patterns)
+    if not any('\\' in p for p in patterns):
+        return normalized, normalized
+    return normalized, _compile_glob_alternation(patterns)
+
+
+def _stringify_networks(data: Any) -> Any:
+    """Recursively convert IPv4Network values in a config mapping to strings"""
+    if isinstance(data, IPv4Network):
+        return str(data)
+    elif isinstance(data, dict):
+        return {k: _stringify_networks(v) for k, v in data.items()}
+    elif isinstance(data, list):
+        return [_stringify_networks(item) for item in data]
+    else:
+        return data
+
+
+def _digest_children(header: str, child_digests: Iterable[str], trailer: str = "") -> str:
+    """SHA-256 over a header, the sorted child hex digests as raw bytes, then a trailer"""
+    h = hashlib.sha256(header.encode())
+    for digest in sorted(child_digests):
+        h.update(bytes.fromhex(digest))
+    if trailer:
+        h.update(trailer.encode())
+    return h.hexdigest()
+
 
 class CacheView(BaseModel, ABC):
     """Abstract base class for cache views"""
@@ -72,6 +158,31 @@ class CacheView(BaseModel, ABC):
     created_at: datetime = Field(default_factory=datetime.now)
     updated_at: datetime = Field(default_factory=datetime.now)
     
+    # Memoized digests of get_consistency_hash/get_update_hash. Field assignment and the
+    # mutator methods drop them; in-place edits of a field (e.g. `files[k] = ...`) do not,
+    # so containers must be changed through the mutators
+    _consistency_digest: Optional[str] = PrivateAttr(default=None)
+    _update_digest: Optional[str] = PrivateAttr(default=None)
+    
+    def __setattr__(self, name: str, value: Any):
+        super().__setattr__(name, value)
+        if name in type(self).model_fields:
+            self._invalidate_hashes()
+    
+    @field_validator("created_at", "updated_at", mode="wrap")
+    @classmethod
+    def _parse_timestamp(cls, value: Any, handler) -> datetime:
+        """Fall back to now for timestamps that fail to parse"""
+        try:
+            return handler(value)
+        except ValidationError:
+            return datetime.now()
+    
+    def _invalidate_hashes(self):
+        """Drop memoized digests so the next get_*_hash call recomputes them"""
+        self._consistency_digest = None
+        self._update_digest = None
+    
     @abstractmethod
     def get_hash(self) -> str:
         """Generate a hash representing the current state (legacy method)"""
@@ -99,6 +210,7 @@ class FileCacheView(CacheView):
     content_hash: str
     size: int
     mtime: float  # modification time, no use
+    synced_mtime_ns: Optional[int] = None  # mtime of the copy synced to the output directory
     
     def get_hash(self) -> str:
         """Generate hash based on file metadata"""
@@ -106,13 +218,19 @@ class FileCacheView(CacheView):
     
     def get_consistency_hash(self) -> str:
         """Generate hash for consistency checking"""
-        content = f"{self.path}:{self.content_hash}:{self.size}"
-        return hashlib.sha256(content.encode()).hexdigest()
+        if self._consistency_digest is None:
+            # Same digest as sha256(f"{path}:{content_hash}:{size}"), without building the string
+            h = hashlib.sha256(self.path.encode())
+            h.update(b":")
+            h.update(self.content_hash.encode())
+            h.update(b":")
+            h.update(str(self.size).encode())
+            self._consistency_digest = h.hexdigest()
+        return self._consistency_digest
     
     def get_update_hash(self) -> str:
-        """Generate hash for update checking"""
-        content = f"{self.path}:{self.content_hash}:{self.size}"
-        return hashlib.sha256(content.encode()).hexdigest()
+        """Generate hash for update checking (same inputs as the consistency hash)"""
+        return self.get_consistency_hash()
     
     @classmethod
     def from_file_path(cls, file_path: DNSBPath, fs: FileSystem) -> "FileCacheView":
@@ -127,8 +245,7 @@ class FileCacheView(CacheView):
             raise DNSBNotADirectoryError(f"Path is a directory, not a file: {file_path}")
         
         # Calculate content hash
-        content = fs.read_bytes(file_path)
-        content_hash = hashlib.sha256(content).hexdigest()
+        content_hash = hash_content(file_path, fs)
         
         return cls(
             path=str(file_path),
@@ -137,9 +254,21 @@ class FileCacheView(CacheView):
             content_hash=content_hash,
         )
     
+    @classmethod
+    def from_scanned_file(cls, file_path: DNSBPath, fs: FileSystem) -> "FileCacheView":
+        """Create FileCacheView for a file found by a directory walk, skipping existence/type checks"""
+        stat = fs.stat(file_path)
+        return cls(
+            path=str(file_path),
+            size=stat.st_size,
+            mtime=stat.st_mtime,
+            content_hash=hash_content(file_path, fs),
+        )
+    
     def set_rel_path(self, rel_path: str):
         """Set the relative path for this file cache view"""
         self.path = rel_path
+        self._invalidate_hashes()
 
 
 class ServiceCacheView(CacheView):
@@ -150,38 +279,49 @@ class ServiceCacheView(CacheView):
     ip: Optional[str] = None  # Service IP address
     files: Dict[str, FileCacheView] = Field(default_factory=dict)
     
+    @field_serializer("build_config", when_used="json")
+    def _serialize_build_config(self, build_config: Dict[str, Any]) -> Dict[str, Any]:
+        return _stringify_networks(build_config)
+    
     def get_hash(self) -> str:
         """Generate hash based on service configuration and files"""
         return self.get_consistency_hash()
     
     def get_consistency_hash(self) -> str:
         """Generate hash for consistency checking"""
-        files_hash = "".join(sorted([f.get_consistency_hash() for f in self.files.values()]))
-        content = f"{self.name}:{files_hash}"
-        return hashlib.sha256(content.encode()).hexdigest()
+        if self._consistency_digest is None:
+            self._consistency_digest = _digest_children(
+                f"{self.name}:", (f.get_consistency_hash() for f in self.files.values())
+            )
+        return self._consistency_digest
     
     def get_update_hash(self) -> str:
         """Generate hash for update checking"""
-        # Get update hashes from all files
-        files_hash = "".join(sorted([f.get_update_hash() for f in self.files.values()]))
+        if self._update_digest is not None:
+            return self._update_digest
         filtered_config = {k: v for k, v in self.build_config.items() 
                           if k not in ex_serv_keys}
         config_str = str(sorted(filtered_config.items()))
         
         # Include IP in the hash calculation
         ip_str = self.ip or ""
-        content = f"{self.name}:{config_str}:{ip_str}:{files_hash}"
-        return hashlib.sha256(content.encode()).hexdigest()
+        # Fold in update hashes from all files
+        self._update_digest = _digest_children(
+            f"{self.name}:{config_str}:{ip_str}:", (f.get_update_hash() for f in self.files.values())
+        )
+        return self._update_digest
     
     def add_file(self, file_view: FileCacheView):
         """Add a file to this service's cache view"""
         self.files[file_view.path] = file_view
+        self._invalidate_hashes()
         self.update_timestamp()
     
     def remove_file(self, file_path: str):
         """Remove a file from this service's cache view"""
         if file_path in self.files:
             del self.files[file_path]
+            self._invalidate_hashes()
             self.update_timestamp()
     
     def scan(self, directory: DNSBPath, fs: FileSystem, is_ignore: bool = True, ignore_patterns: Optional[List[str]] = None):
@@ -202,29 +342,70 @@ class ServiceCacheView(CacheView):
         elif ignore_patterns is None:
             ignore_patterns = self._load_ignore_patterns(abs_directory, fs)
         
-        for file_path in fs.rglob(abs_directory, "**/*"):
-            if fs.is_file(file_path):
-                rel_path = str(fs.relative_to(file_path, abs_directory))
+        # Compiled once per scan rather than looked up for every path
+        file_matcher = _compile_ignore_patterns(tuple(ignore_patterns))
+        dir_matcher = _compile_ignore_patterns(tuple(self._dir_prune_patterns(ignore_patterns)))
+        pending = []
+        for dir_path, dir_names, file_names in fs.walk(abs_directory):
+            rel_dir = str(fs.relative_to(dir_path, abs_directory))
+            prefix = "" if rel_dir == "." else f"{rel_dir}/"
+
+            # Don't descend into directories whose whole subtree is ignored
+            if dir_matcher[0] is not None:
+                dir_names[:] = [
+                    name for name in dir_names
+                    if not _match_ignore(prefix + name, dir_matcher)
+                ]
+
+            for name in file_names:
+                rel_path = prefix + name
+                file_path = dir_path / name
                 
                 # Check if file should be ignored
-                if self._should_ignore_file(rel_path, ignore_patterns):
+                if _match_ignore(rel_path, file_matcher):
                     logger.debug(f"Ignoring file: {rel_path}")
                     continue
-                
-                try:
-                    current_file = FileCacheView.from_file_path(file_path, fs)
-                    # Set to relative path for consistent storage
-                    current_file.set_rel_path(rel_path)
-                    self.files[rel_path] = current_file
-                except (DNSBPathNotFoundError, DNSBNotADirectoryError) as e:
-                    # Log error but continue processing other files
-                    logger.warning(f"Could not process file {file_path}: {e}")
-                except UnicodeDecodeError as e:
-                    # Skip binary files that can't be decoded as UTF-8
-                    logger.debug(f"Skipping binary file {file_path}: {e}")
-                except Exception as e:
-                    # Log unexpected errors but continue processing
-                    logger.warning(f"Unexpected error processing file {file_path}: {e}")
+                pending.append((rel_path, file_path))
+
+        if len(pending) > 1:
+            with ThreadPoolExecutor(max_workers=min(MAX_HASH_WORKERS, len(pending))) as executor:
+                views = list(executor.map(lambda item: self._scan_file(*item, fs), pending))
+        else:
+            views = [self._scan_file(rel_path, file_path, fs) for rel_path, file_path in pending]
+
+        # Collected on this thread, in walk order
+        for (rel_path, _), current_file in zip(pending, views):
+            if current_file is not None:
+                self.files[rel_path] = current_file
+        self._invalidate_hashes()
+    
+    @staticmethod
+    def _scan_file(rel_path: str, file_path: DNSBPath, fs: FileSystem) -> Optional[FileCacheView]:
+        """Hash one scanned file; returns None (after logging) if it can't be processed"""
+        try:
+            current_file = FileCacheView.from_scanned_file(file_path, fs)
+            # Set to relative path for consistent storage
+            current_file.set_rel_path(rel_path)
+            return current_file
+        except (DNSBPathNotFoundError, DNSBNotADirectoryError) as e:
+            # Log error but continue processing other files
+            logger.warning(f"Could not process file {file_path}: {e}")
+        except UnicodeDecodeError as e:
+            # Skip binary files that can't be decoded as UTF-8
+            logger.debug(f"Skipping binary file {file_path}: {e}")
+        except Exception as e:
+            # Log unexpected errors but continue processing
+            logger.warning(f"Unexpected error processing file {file_path}: {e}")
+        return None
+    
+    @staticmethod
+    def _dir_prune_patterns(patterns: List[str]) -> List[str]:
+        """Directory patterns from '<dir pattern>/**' ignore patterns
+        
+        A directory matching one of these has every file below it ignored, so its subtree
+        can be pruned. Other patterns can only be decided per file.
+        """
+        return [p[:-3] for p in patterns if p.endswith("/**")]
     
     def _should_ignore_file(self, file_path: str, patterns: List[str]) -> bool:
         """Check if a file should be ignored based on patterns
@@ -235,16 +416,7 @@ class ServiceCacheView(CacheView):
         Returns:
             True if file should be ignored, False otherwise
         """
-        normalized_path = file_path.replace('\\', '/')
-        
-        for pattern in patterns:
-            normalized_pattern = pattern.replace('\\', '/')
-            if fnmatch.fnmatch(normalized_path, normalized_pattern):
-                return True
-            if fnmatch.fnmatch(file_path, pattern):
-                return True
-        
-        return False
+        return _match_ignore(file_path, _compile_ignore_patterns(tuple(patterns)))
     
     def _load_ignore_patterns(self, directory: DNSBPath, fs: FileSystem) -> List[str]:
         """Load ignore patterns from .dnsbignore and combine with defaults
@@ -292,6 +464,11 @@ class ProjectCacheView(CacheView):
     services: Dict[str, ServiceCacheView] = Field(default_factory=dict)
     docker_compose_hash: Optional[str] = None
     output_dir: str
+    hash_algorithm: str = CONTENT_HASH_ALGORITHM  # algorithm of content_hash/docker_compose_hash
+    
+    @field_serializer("proj_config", when_used="json")
+    def _serialize_proj_config(self, proj_config: Dict[str, Any]) -> Dict[str, Any]:
+        return _stringify_networks(proj_config)
     
     def get_hash(self) -> str:
         """Generate hash based on project configuration and services"""
@@ -299,22 +476,20 @@ class ProjectCacheView(CacheView):
     
     def get_consistency_hash(self) -> str:
         """Generate hash for consistency checking"""
-        services_hash = "".join(sorted([s.get_consistency_hash() for s in self.services.values()]))
         docker_compose_part = f":{self.docker_compose_hash}" if self.docker_compose_hash else ""
-        content = f"{self.name}:{services_hash}{docker_compose_part}"
-        return hashlib.sha256(content.encode()).hexdigest()
+        return _digest_children(
+            f"{self.name}:", (s.get_consistency_hash() for s in self.services.values()), docker_compose_part
+        )
     
     def get_update_hash(self) -> str:
         """Generate hash for update checking"""
-        # Get update hashes from all services
-        services_hash = "".join(sorted([s.get_update_hash() for s in self.services.values()]))
-        
         filtered_config = {k: v for k, v in self.proj_config.items() 
                           if k not in ex_proj_keys}
         config_str = str(sorted(filtered_config.items()))
-        # Include filtered project metadata
-        content = f"{self.name}:{config_str}:{services_hash}"
-        return hashlib.sha256(content.encode()).hexdigest()
+        # Include filtered project metadata, then update hashes from all services
+        return _digest_children(
+            f"{self.name}:{config_str}:", (s.get_update_hash() for s in self.services.values())
+        )
     
     def add_service(self, service_view: ServiceCacheView):
         """Add a service to this project's cache view"""
@@ -368,8 +543,7 @@ class ProjectCacheView(CacheView):
             if not fs.exists(docker_compose_path):
                 return None
             
-            content = fs.read_bytes(docker_compose_path)
-            return hashlib.sha256(content).hexdigest()
+            return hash_content(docker_compose_path, fs)
             
         except Exception as e:
             logger.error(f"Error calculating docker-compose hash: {e}")
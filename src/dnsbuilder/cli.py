@@ -1,15 +1,10 @@
 import click
+import functools
 import logging
+import os
 import traceback
-import asyncio
-import uvicorn
-import yaml
-from python_on_whales import DockerClient, docker
 from pathlib import Path as StdPath
 
-from .config import Config, load_plugins_from_config
-from .registry import initialize_registries
-from .builder import Builder, CachedBuilder
 from .utils import setup_logger
 from .io import create_app_fs, DNSBPath, Path
 from .exceptions import (
@@ -18,27 +13,102 @@ from .exceptions import (
     DefinitionError,
     BuildError,
 )
-from .api.main import app
 from . import __version__
 
+# asyncio, yaml, python_on_whales, the uvicorn/FastAPI app and the config/registry/builder
+# modules are imported inside the commands that use them. Note that the package's own
+# __init__ still imports config and builder (and with them yaml and pydantic) eagerly
+
 def complete_config_files(ctx, param, incomplete):
     """Auto-complete .yml and .yaml config files in current directory"""
     try:
-        cwd = StdPath.cwd()
-        # Find all yml/yaml files
-        yml_files = list(cwd.glob('*.yml')) + list(cwd.glob('*.yaml'))
-        
-        # Get relative paths and filter by incomplete input
-        file_names = [
-            f.name for f in yml_files
-            if f.name.startswith(incomplete)
-        ]
+        # One directory read; DirEntry answers is_file from it without another stat
+        with os.scandir('.') as entries:
+            file_names = [
+                entry.name for entry in entries
+                if entry.name.startswith(incomplete)
+                and entry.name.endswith(('.yml', '.yaml'))
+                and entry.is_file()
+            ]
         
         return sorted(file_names)
     except Exception as e:
         logging.debug(f"Config file auto-completion failed: {e}")
         return []
 
+def _yaml_safe_loader():
+    """PyYAML's libyaml-backed CSafeLoader, or the pure-Python SafeLoader without libyaml"""
+    try:
+        from yaml import CSafeLoader as SafeLoader
+    except ImportError:
+        from yaml import SafeLoader
+    return SafeLoader
+
+
+def _scalar_is_str(event) -> bool:
+    """Whether a scalar event constructs a str, resolving its tag as the YAML composer does"""
+    import yaml
+    
+    tag = event.tag
+    if tag is None or tag == '!':
+        tag = yaml.resolver.Resolver().resolve(yaml.ScalarNode, event.value, event.implicit)
+    return tag == 'tag:yaml.org,2002:str'
+
+
+def _read_yaml_outline(stream, keys, loader) -> dict:
+    """Read selected top-level entries of a YAML document from parse events
+    
+    Stops as soon as every key in `keys` has been read, and never constructs the
+    document's nested nodes.
+    
+    Returns:
+        Dict of found keys: a scalar value as its string if it loads as a str (None for
+        null, numbers, booleans and other tags), a mapping value as the list of its
+        keys, anything else (sequences, aliases) as None
+    """
+    import yaml
+    
+    wanted = set(keys)
+    outline = {}
+    stack = []  # per open collection: [is_mapping, next_node_is_key]
+    current = None  # wanted top-level key whose value is being read
+    for event in yaml.parse(stream, Loader=loader):
+        if isinstance(event, yaml.CollectionEndEvent):
+            stack.pop()
+            if current is not None and len(stack) == 1:
+                current = None
+                if wanted <= outline.keys():
+                    break
+            continue
+        if isinstance(event, yaml.DocumentEndEvent):
+            break
+        if not isinstance(event, yaml.NodeEvent):
+            continue
+        
+        is_key = bool(stack) and stack[-1][0] and stack[-1][1]
+        if stack and stack[-1][0]:
+            stack[-1][1] = not stack[-1][1]
+        depth = len(stack)
+        
+        if depth == 1 and is_key:
+            current = event.value if isinstance(event, yaml.ScalarEvent) and event.value in wanted else None
+        elif depth == 1 and current is not None:
+            if isinstance(event, yaml.ScalarEvent):
+                outline[current] = event.value if _scalar_is_str(event) else None
+                current = None
+                if wanted <= outline.keys():
+                    break
+            else:
+                outline[current] = [] if isinstance(event, yaml.MappingStartEvent) else None
+        elif depth == 2 and is_key and current is not None and isinstance(event, yaml.ScalarEvent):
+            if isinstance(outline[current], list):
+                outline[current].append(event.value)
+        
+        if isinstance(event, yaml.CollectionStartEvent):
+            stack.append([isinstance(event, yaml.MappingStartEvent), True])
+    return outline
+
+
 def complete_services(ctx, param, incomplete):
     """Auto-complete service names from docker-compose.yml"""
     config_file = ctx.params.get('config_file')
@@ -46,6 +116,9 @@ def complete_services(ctx, param, incomplete):
         return []
     
     try:
+        # libyaml's C loader when available, this runs on every completion keystroke
+        SafeLoader = _yaml_safe_loader()
+        
         # Get absolute path and workdir
         config_path = StdPath(config_file)
         if not config_path.is_absolute():
@@ -54,11 +127,10 @@ def complete_services(ctx, param, incomplete):
         if not config_path.exists():
             return []
         
-        # Parse config file to get project name directly
+        # Scan config file for the project name only
         with open(config_path, 'r') as f:
-            config_data = yaml.safe_load(f)
+            project_name = _read_yaml_outline(f, ['name'], SafeLoader).get('name')
         
-        project_name = config_data.get('name')
         if not project_name:
             return []
         
@@ -79,12 +151,13 @@ def complete_services(ctx, param, incomplete):
         compose_file = output_dir / "docker-compose.yml"
         if not compose_file.exists():
             return []
+        # Only the service names are needed, not the whole compose document
         with open(compose_file, 'r') as f:
-            compose_data = yaml.safe_load(f)
-        
-        services = compose_data.get('services', {})
+            services = _read_yaml_outline(f, ['services'], SafeLoader).get('services')
+        if not isinstance(services, list):
+            return []
         service_names = [
-            name for name in sorted(services.keys())
+            name for name in sorted(services)
             if not name.startswith('dnsb-image-builder-') and name.startswith(incomplete)
         ]
         
@@ -147,6 +220,44 @@ def get_paths(config_file: str, workdir: str = None, output_dir: str = None):
     return (abs_cfg, config_root, output_dir_path)
 
 
+def _read_project_name(abs_cfg: str, fs) -> str | None:
+    """Read the top-level `name` of a config file without loading the whole config
+    
+    Only a `name` that Config would take as-is is returned: a top-level name overrides
+    included files, and a scalar that loads as a str passes validation unchanged.
+    Anything else (missing, empty, null, non-str scalar, alias) gives None, and the
+    caller falls back to the full Config.
+    """
+    # Stream the file so the parser only pulls in the leading chunk holding `name`
+    with fs.open(DNSBPath(abs_cfg), "rb") as f:
+        name = _read_yaml_outline(f, ['name'], _yaml_safe_loader()).get('name')
+    return name or None
+
+
+def _resolve_project(config_file: str, workdir: str = None, output_dir: str = None):
+    """Find the project name and locate its docker-compose.yml
+    
+    Shared by the commands that act on an already built project, which only need
+    the name; the full config is loaded only when the file doesn't set it itself.
+    
+    Returns:
+        Tuple of (project_name, compose_file)
+    """
+    abs_cfg, config_root, output_dir_base = get_paths(config_file, workdir, output_dir)
+    
+    cache_root = output_dir_base / ".dnsb_cache"
+    cli_fs = create_app_fs(use_vfs=False, chroot=config_root, cache_root=cache_root)
+    project_name = _read_project_name(abs_cfg, cli_fs)
+    if project_name is None:
+        from .config import Config
+        
+        # The name may come from an included file, resolved by the full config pipeline
+        workdir_for_attrs = str(config_root) if config_root.protocol == "file" else None
+        project_name = Config(abs_cfg, cli_fs, workdir=workdir_for_attrs).name
+    compose_file = output_dir_base / "output" / project_name / "docker-compose.yml"
+    return project_name, compose_file
+
+
 def setup_logging(debug: bool, log_levels: str = None, log_file: str = None):
     """Setup logger with debug and module-level configuration"""
     module_levels = None
@@ -175,6 +286,9 @@ def init_with_plugins(config_path: str, fs=None):
     Returns:
         True if initialization succeeded
     """
+    from .config import load_plugins_from_config
+    from .registry import initialize_registries
+    
     # Load plugins list from config
     plugins = load_plugins_from_config(config_path, fs)
 
@@ -184,43 +298,28 @@ def init_with_plugins(config_path: str, fs=None):
     return True
 
 
+# Checked in order, so subclasses come before DNSBuilderError
+_ERROR_PREFIXES = {
+    ConfigurationError: "Configuration error",
+    DefinitionError: "Definition error",
+    BuildError: "Build error",
+    DNSBuilderError: "An unexpected application error occurred",
+    FileNotFoundError: "A required file was not found",
+}
+
+
 def handle_errors(func):
     """Decorator to handle common exceptions"""
+    @functools.wraps(func)
     def wrapper(*args, **kwargs):
         try:
             return func(*args, **kwargs)
-        except ConfigurationError as e:
-            logging.error(f"Configuration error: {e}")
-            ctx = click.get_current_context()
-            if ctx.obj.get('debug'):
-                traceback.print_exc()
-            raise click.Abort()
-        except DefinitionError as e:
-            logging.error(f"Definition error: {e}")
-            ctx = click.get_current_context()
-            if ctx.obj.get('debug'):
-                traceback.print_exc()
-            raise click.Abort()
-        except BuildError as e:
-            logging.error(f"Build error: {e}")
-            ctx = click.get_current_context()
-            if ctx.obj.get('debug'):
-                traceback.print_exc()
-            raise click.Abort()
-        except DNSBuilderError as e:
-            logging.error(f"An unexpected application error occurred: {e}")
-            ctx = click.get_current_context()
-            if ctx.obj.get('debug'):
-                traceback.print_exc()
-            raise click.Abort()
-        except FileNotFoundError as e:
-            logging.error(f"A required file was not found: {e}")
-            ctx = click.get_current_context()
-            if ctx.obj.get('debug'):
-                traceback.print_exc()
-            raise click.Abort()
         except Exception as e:
-            logging.error(f"An unexpected error occurred: {e}")
+            prefix = next(
+                (msg for exc_type, msg in _ERROR_PREFIXES.items() if isinstance(e, exc_type)),
+                "An unexpected error occurred",
+            )
+            logging.error(f"{prefix}: {e}")
             ctx = click.get_current_context()
             if ctx.obj.get('debug'):
                 traceback.print_exc()
@@ -230,7 +329,15 @@ def handle_errors(func):
 
 @handle_errors
 def do_build(config_file: str, incremental: bool, graph: str, workdir: str, output_dir: str, vfs: bool):
-    """Execute build command"""
+    """Execute build command
+    
+    Returns:
+        Tuple of (config, actual_output_dir) so callers don't parse the config again
+    """
+    import asyncio
+    from .config import Config
+    from .builder import Builder, CachedBuilder
+    
     abs_cfg, config_root, output_dir_base = get_paths(config_file, workdir, output_dir)
 
     # Get the actual workdir path for .dnsbattribute loading
@@ -259,23 +366,60 @@ def do_build(config_file: str, incremental: bool, graph: str, workdir: str, outp
         logging.info("Using standard build")
     
     asyncio.run(builder.run())
+    return config, actual_output_dir
+
+
+def _remove_images(docker, images) -> int:
+    """Remove images with one `docker image rm` call, returns how many were removed"""
+    try:
+        docker.image.remove([img.id for img in images], force=False)
+    except Exception as e:
+        # Some removals failed; report per image, skipping the ones that did go
+        logging.debug(f"Batch image removal failed: {e}")
+    else:
+        for img in images:
+            tag_name = img.repo_tags[0] if img.repo_tags else img.id[:12]
+            logging.debug(f"Removed image: {tag_name}")
+        return len(images)
+    
+    removed = 0
+    for img in images:
+        tag_name = img.repo_tags[0] if img.repo_tags else img.id[:12]
+        if not docker.image.exists(img.id):
+            removed += 1
+            logging.debug(f"Removed image: {tag_name}")
+            continue
+        try:
+            docker.image.remove(img.id, force=False)
+            removed += 1
+            logging.debug(f"Removed image: {tag_name}")
+        except Exception as e:
+            logging.warning(f"Failed to remove image {img.id[:12]}: {e}")
+    return removed
+
+
+def _list_prefixed_images(docker, prefix: str):
+    """Images whose repository name starts with `prefix`, filtered by the daemon
+    
+    The pattern is a `reference` filter (`docker image ls <prefix>*`), globbed against
+    the repository name: `*` does not cross `/`, so single-component names such as the
+    `dnsb-<software>-<version>-<hash>` and `<project>-<service>` images dnsbuilder builds
+    match, while namespaced ones (`dnsb-x/y`) do not. Untagged images have no reference
+    and never match, as with a prefix check over repo tags.
+    """
+    return docker.image.list(f'{prefix}*')
 
 
 @handle_errors
 def do_clean(config_file: str, all_images: bool, workdir: str, output_dir: str):
     """Execute clean command"""
+    from python_on_whales import docker
+    
     if all_images:
         # Clean all dnsb-* images
         logging.info("Cleaning all dnsb-generated shared images...")
         
-        # Get all images
-        all_imgs = docker.image.list()
-        
-        # Filter images with 'dnsb-' prefix in tags
-        dnsb_images = []
-        for img in all_imgs:
-            if img.repo_tags and any(tag.startswith('dnsb-') for tag in img.repo_tags):
-                dnsb_images.append(img)
+        dnsb_images = _list_prefixed_images(docker, 'dnsb-')
         
         if not dnsb_images:
             logging.info("No dnsb-* images found.")
@@ -283,51 +427,20 @@ def do_clean(config_file: str, all_images: bool, workdir: str, output_dir: str):
         
         # Remove images
         logging.info(f"Found {len(dnsb_images)} dnsb-* images, removing...")
-        removed = 0
-        for img in dnsb_images:
-            try:
-                docker.image.remove(img.id, force=False)
-                removed += 1
-                tag_name = img.repo_tags[0] if img.repo_tags else img.id[:12]
-                logging.debug(f"Removed image: {tag_name}")
-            except Exception as e:
-                logging.warning(f"Failed to remove image {img.id[:12]}: {e}")
+        removed = _remove_images(docker, dnsb_images)
         
         logging.info(f"Successfully cleaned {removed}/{len(dnsb_images)} dnsb-* images.")
     
     elif config_file:
-        abs_cfg, config_root, output_dir_base = get_paths(config_file, workdir, output_dir)
-        
-        # Get the actual workdir path for .dnsbattribute loading
-        if config_root.protocol == "file":
-            workdir_for_attrs = str(config_root)
-        else:
-            workdir_for_attrs = None
-        
-        cache_root = output_dir_base / ".dnsb_cache"
-        cli_fs = create_app_fs(use_vfs=False, chroot=config_root, cache_root=cache_root)
-        config = Config(abs_cfg, cli_fs, workdir=workdir_for_attrs)
-        project_name = config.name
-        all_imgs = docker.image.list()
-        project_images = []
-        for img in all_imgs:
-            if img.repo_tags and any(tag.startswith(f'{project_name}-') for tag in img.repo_tags):
-                project_images.append(img)
+        project_name, _ = _resolve_project(config_file, workdir, output_dir)
+        project_images = _list_prefixed_images(docker, f'{project_name}-')
         
         if not project_images:
             logging.info(f"No images found for project '{project_name}'.")
             return
         
         logging.info(f"Cleaning images for project '{project_name}'...")
-        removed = 0
-        for img in project_images:
-            try:
-                docker.image.remove(img.id, force=False)
-                removed += 1
-                tag_name = img.repo_tags[0] if img.repo_tags else img.id[:12]
-                logging.debug(f"Removed image: {tag_name}")
-            except Exception as e:
-                logging.warning(f"Failed to remove image {img.id[:12]}: {e}")
+        removed = _remove_images(docker, project_images)
         
         logging.info(f"Successfully cleaned {removed}/{len(project_images)} images for project '{project_name}'.")
     
@@ -339,28 +452,18 @@ def do_clean(config_file: str, all_images: bool, workdir: str, output_dir: str):
 @handle_errors
 def do_down(config_file: str, workdir: str, output_dir: str, remove_volumes: bool, clean_images: bool):
     """Execute down command - stop containers and clean up"""
-    abs_cfg, config_root, output_dir_base = get_paths(config_file, workdir, output_dir)
-    
-    # Get the actual workdir path for .dnsbattribute loading
-    if config_root.protocol == "file":
-        workdir_for_attrs = str(config_root)
-    else:
-        workdir_for_attrs = None
+    from python_on_whales import DockerClient
     
-    cache_root = output_dir_base / ".dnsb_cache"
-    cli_fs = create_app_fs(use_vfs=False, chroot=config_root, cache_root=cache_root)
-    config = Config(abs_cfg, cli_fs, workdir=workdir_for_attrs)
-    project_name = config.name
-    actual_output_dir = output_dir_base / "output" / project_name
-    compose_file = actual_output_dir / "docker-compose.yml"
+    project_name, compose_file = _resolve_project(config_file, workdir, output_dir)
     
-    if not StdPath(str(compose_file)).exists():
+    compose_str = str(compose_file)
+    if not os.path.exists(compose_str):
         logging.error(f"docker-compose.yml not found at {compose_file}")
         logging.info("Project may not be built yet.")
         return
     
     logging.info(f"Stopping project '{project_name}'...")
-    docker_client = DockerClient(compose_files=[str(compose_file)])
+    docker_client = DockerClient(compose_files=[compose_str])
     remove_images = 'local' if clean_images else None
     
     try:
@@ -384,21 +487,17 @@ def do_down(config_file: str, workdir: str, output_dir: str, remove_volumes: boo
 @handle_errors
 def do_run(config_file: str, incremental: bool, graph: str, workdir: str, output_dir: str, vfs: bool, detach: bool, build_images: bool):
     """Execute run command - build and start the project"""
-    # First, build the project
-    logging.info("Building project...")
-    do_build(config_file, incremental, graph, workdir, output_dir, vfs)
+    from python_on_whales import DockerClient
     
-    # Get paths for compose file
-    abs_cfg, config_root, output_dir_base = get_paths(config_file, workdir, output_dir)
-    cache_root = output_dir_base / ".dnsb_cache"
-    cli_fs = create_app_fs(use_vfs=False, chroot=config_root, cache_root=cache_root)
-    config = Config(abs_cfg, cli_fs)
+    # First, build the project, reusing its parsed config for the compose file location
+    logging.info("Building project...")
+    config, actual_output_dir = do_build(config_file, incremental, graph, workdir, output_dir, vfs)
     
     project_name = config.name
-    actual_output_dir = output_dir_base / "output" / project_name
     compose_file = actual_output_dir / "docker-compose.yml"
     
-    if not StdPath(str(compose_file)).exists():
+    compose_str = str(compose_file)
+    if not os.path.exists(compose_str):
         logging.error(f"docker-compose.yml not found at {compose_file}")
         raise click.Abort()
     
@@ -406,7 +505,7 @@ def do_run(config_file: str, incremental: bool, graph: str, workdir: str, output
     
     # Use python-on-whales to start containers
     docker_client = DockerClient(
-        compose_files=[str(compose_file)],
+        compose_files=[compose_str],
         compose_profiles=["donotstart"]  # Include builder services in project scope
     )
     
@@ -435,16 +534,12 @@ def do_run(config_file: str, incremental: bool, graph: str, workdir: str, output
 @handle_errors
 def do_up(config_file: str, workdir: str, output_dir: str, detach: bool):
     """Execute up command - start existing project without building"""
-    abs_cfg, config_root, output_dir_base = get_paths(config_file, workdir, output_dir)
-    cache_root = output_dir_base / ".dnsb_cache"
-    cli_fs = create_app_fs(use_vfs=False, chroot=config_root, cache_root=cache_root)
-    config = Config(abs_cfg, cli_fs)
+    from python_on_whales import DockerClient
     
-    project_name = config.name
-    actual_output_dir = output_dir_base / "output" / project_name
-    compose_file = actual_output_dir / "docker-compose.yml"
+    project_name, compose_file = _resolve_project(config_file, workdir, output_dir)
     
-    if not StdPath(str(compose_file)).exists():
+    compose_str = str(compose_file)
+    if not os.path.exists(compose_str):
         logging.error(f"docker-compose.yml not found at {compose_file}")
         logging.info("Please run 'dnsb build' first.")
         raise click.Abort()
@@ -452,7 +547,7 @@ def do_up(config_file: str, workdir: str, output_dir: str, detach: bool):
     logging.info(f"Starting project '{project_name}'...")
     
     docker_client = DockerClient(
-        compose_files=[str(compose_file)],
+        compose_files=[compose_str],
         compose_profiles=["donotstart"]  # Include builder services in project scope
     )
     
@@ -478,20 +573,16 @@ def do_up(config_file: str, workdir: str, output_dir: str, detach: bool):
 @handle_errors
 def do_exec(config_file: str, workdir: str, output_dir: str, service: str, command: tuple, interactive: bool, user: str):
     """Execute command in a running service container"""
-    abs_cfg, config_root, output_dir_base = get_paths(config_file, workdir, output_dir)
-    cache_root = output_dir_base / ".dnsb_cache"
-    cli_fs = create_app_fs(use_vfs=False, chroot=config_root, cache_root=cache_root)
-    config = Config(abs_cfg, cli_fs)
+    from python_on_whales import DockerClient
     
-    project_name = config.name
-    actual_output_dir = output_dir_base / "output" / project_name
-    compose_file = actual_output_dir / "docker-compose.yml"
+    _, compose_file = _resolve_project(config_file, workdir, output_dir)
     
-    if not StdPath(str(compose_file)).exists():
+    compose_str = str(compose_file)
+    if not os.path.exists(compose_str):
         logging.error(f"docker-compose.yml not found at {compose_file}")
         raise click.Abort()
     
-    docker_client = DockerClient(compose_files=[str(compose_file)])
+    docker_client = DockerClient(compose_files=[compose_str])
     
     try:
         # Convert command tuple to list
@@ -512,20 +603,16 @@ def do_exec(config_file: str, workdir: str, output_dir: str, service: str, comma
 @handle_errors
 def do_logs(config_file: str, workdir: str, output_dir: str, services: tuple, follow: bool, tail: int):
     """Show logs from services"""
-    abs_cfg, config_root, output_dir_base = get_paths(config_file, workdir, output_dir)
-    cache_root = output_dir_base / ".dnsb_cache"
-    cli_fs = create_app_fs(use_vfs=False, chroot=config_root, cache_root=cache_root)
-    config = Config(abs_cfg, cli_fs)
+    from python_on_whales import DockerClient
     
-    project_name = config.name
-    actual_output_dir = output_dir_base / "output" / project_name
-    compose_file = actual_output_dir / "docker-compose.yml"
+    _, compose_file = _resolve_project(config_file, workdir, output_dir)
     
-    if not StdPath(str(compose_file)).exists():
+    compose_str = str(compose_file)
+    if not os.path.exists(compose_str):
         logging.error(f"docker-compose.yml not found at {compose_file}")
         raise click.Abort()
     
-    docker_client = DockerClient(compose_files=[str(compose_file)])
+    docker_client = DockerClient(compose_files=[compose_str])
     
     try:
         service_list = list(services) if services else None
@@ -544,20 +631,16 @@ def do_logs(config_file: str, workdir: str, output_dir: str, services: tuple, fo
 @handle_errors
 def do_ps(config_file: str, workdir: str, output_dir: str):
     """List containers for the project"""
-    abs_cfg, config_root, output_dir_base = get_paths(config_file, workdir, output_dir)
-    cache_root = output_dir_base / ".dnsb_cache"
-    cli_fs = create_app_fs(use_vfs=False, chroot=config_root, cache_root=cache_root)
-    config = Config(abs_cfg, cli_fs)
+    from python_on_whales import DockerClient
     
-    project_name = config.name
-    actual_output_dir = output_dir_base / "output" / project_name
-    compose_file = actual_output_dir / "docker-compose.yml"
+    project_name, compose_file = _resolve_project(config_file, workdir, output_dir)
     
-    if not StdPath(str(compose_file)).exists():
+    compose_str = str(compose_file)
+    if not os.path.exists(compose_str):
         logging.error(f"docker-compose.yml not found at {compose_file}")
         raise click.Abort()
     
-    docker_client = DockerClient(compose_files=[str(compose_file)])
+    docker_client = DockerClient(compose_files=[compose_str])
     
     containers = docker_client.compose.ps()
     
@@ -565,35 +648,35 @@ def do_ps(config_file: str, workdir: str, output_dir: str):
         logging.info(f"No containers found for project '{project_name}'.")
         return
     
-    # Print header
-    click.echo(f"{'NAME':<30} {'STATUS':<20} {'PORTS':<40}")
-    click.echo("-" * 90)
-    
-    # Print each container
+    # Header, then one line per container, written with a single echo
+    lines = [f"{'NAME':<30} {'STATUS':<20} {'PORTS':<40}", "-" * 90]
     for container in containers:
         name = container.name
         status = container.state.status
-        ports = ', '.join([f"{p.host_port}->{p.container_port}" for p in container.network_settings.ports.values() if p]) if container.network_settings.ports else ''
-        click.echo(f"{name:<30} {status:<20} {ports:<40}")
+        # Published ports map "<port>/<proto>" to a list of host bindings (or None)
+        port_map = container.network_settings.ports or {}
+        ports = ', '.join(
+            f"{binding.host_port}->{container_port}"
+            for container_port, bindings in port_map.items() if bindings
+            for binding in bindings
+        )
+        lines.append(f"{name:<30} {status:<20} {ports:<40}")
+    click.echo("\n".join(lines))
 
 
 @handle_errors
 def do_restart(config_file: str, workdir: str, output_dir: str, services: tuple):
     """Restart services"""
-    abs_cfg, config_root, output_dir_base = get_paths(config_file, workdir, output_dir)
-    cache_root = output_dir_base / ".dnsb_cache"
-    cli_fs = create_app_fs(use_vfs=False, chroot=config_root, cache_root=cache_root)
-    config = Config(abs_cfg, cli_fs)
+    from python_on_whales import DockerClient
     
-    project_name = config.name
-    actual_output_dir = output_dir_base / "output" / project_name
-    compose_file = actual_output_dir / "docker-compose.yml"
+    _, compose_file = _resolve_project(config_file, workdir, output_dir)
     
-    if not StdPath(str(compose_file)).exists():
+    compose_str = str(compose_file)
+    if not os.path.exists(compose_str):
         logging.error(f"docker-compose.yml not found at {compose_file}")
         raise click.Abort()
     
-    docker_client = DockerClient(compose_files=[str(compose_file)])
+    docker_client = DockerClient(compose_files=[compose_str])
     
     service_list = list(services) if services else None
     service_str = ', '.join(services) if services else 'all services'
@@ -841,4 +924,7 @@ def down(ctx, config_file, workdir, output_dir, volumes, clean):
 @click.pass_context
 def ui(ctx):
     """Start web UI server"""
+    import uvicorn
+    from .api.main import app
+    
     uvicorn.run(app, host="0.0.0.0", port=8000)
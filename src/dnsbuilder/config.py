@@ -1,6 +1,6 @@
 import yaml
 import logging
-from typing import Dict, Any, List, Set, Optional, Union
+from typing import Dict, Any, List, Optional, Union
 from pydantic import BaseModel, Field, ValidationError, model_validator, ConfigDict
 from pydantic.networks import IPv4Network
 
@@ -20,6 +20,9 @@ from .exceptions import (
 
 logger = logging.getLogger(__name__)
 
+# libyaml's C loader when PyYAML was built with it; same exceptions as SafeLoader
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 def load_plugins_from_config(config_path: str, fs: FileSystem = None) -> List[str]:
     """
@@ -34,7 +37,7 @@ def load_plugins_from_config(config_path: str, fs: FileSystem = None) -> List[st
 
     try:
         content = fs.read_text(DNSBPath(config_path))
-        config_data = yaml.safe_load(content)
+        config_data = yaml.load(content, Loader=_YAML_LOADER)
 
         if not isinstance(config_data, dict):
             return []
@@ -73,9 +76,11 @@ class DNSSECModel(BaseModel):
     Supports enabling DNSSEC and importing additional DNSSEC records.
     - enable: Boolean to enable/disable DNSSEC signing
     - include: String or list of strings for importing key, rrsig, ds, dnskey records
+    - reuse_keys: Boolean to reuse generated keys across builds (cached under the cache root)
     """
     enable: bool = False
     include: Union[str, List[str]] = Field(default_factory=list)
+    reuse_keys: bool = False
     model_config = ConfigDict(extra="allow")
 
 
@@ -136,6 +141,50 @@ class BuildModel(BaseModel):
             raise ImageDefinitionError(f"A build using a '{constants.STD_BUILD_PREFIX}' reference requires the 'image' key.")
         return self
 
+def _check_ref_cycles(definitions: Dict[str, Union[ImageModel, BuildModel]], kind: str):
+    """
+    Follow every definition's local `ref` chain iteratively with three-color marking.
+    Each definition has at most one ref, so a DFS from a node is a walk along its chain.
+    Raises ReferenceNotFoundError for refs to undefined names, CircularDependencyError for loops.
+    """
+    label = kind.capitalize()
+    # Local refs only (external "image:tag" refs end a chain), resolved once up front
+    local_refs = {
+        name: conf.ref for name, conf in definitions.items()
+        if conf.ref and ':' not in conf.ref
+    }
+    color: Dict[str, int] = {}  # unset: unvisited, 1: on the current chain, 2: checked
+    # Per-node messages are only formatted when debug logging is on
+    debug = logger.isEnabledFor(logging.DEBUG)
+    for start in definitions:
+        if start in color:
+            continue
+        chain = []
+        name = start
+        while True:
+            if debug:
+                logger.debug(f"[Validation] Checking {kind} '{name}' for cycles...")
+            color[name] = 1
+            chain.append(name)
+            ref_name = local_refs.get(name)
+            if ref_name is None:
+                break
+            if debug:
+                logger.debug(f"[Validation] {label} '{name}' has ref to '{ref_name}'. Following reference.")
+            if ref_name not in definitions:
+                raise ReferenceNotFoundError(f"{label} '{name}' has a 'ref' to an undefined {kind}: '{ref_name}'.")
+            state = color.get(ref_name)
+            if state == 1:
+                raise CircularDependencyError(f"Circular dependency in {kind}s: '{name}' -> '{ref_name}' forms a loop.")
+            if state == 2:
+                break
+            name = ref_name
+        for name in reversed(chain):
+            color[name] = 2
+            if debug:
+                logger.debug(f"[Validation] {label} '{name}' passed cycle check.")
+
+
 class ConfigModel(BaseModel):
     """
         Class Config-Validation Model desribe top-level of config
@@ -154,8 +203,10 @@ class ConfigModel(BaseModel):
     @model_validator(mode='after')
     def validate_mirror(self) -> 'ConfigModel':
         """Ensure mirror is a dictionary"""
-        for key in self.mirror.keys():
-            if any(key in aliases for aliases in constants.MIRRORS.values()):
+        # MIRRORS may be extended by .dnsbattribute/plugins, so flatten it per call
+        valid_aliases = {alias for aliases in constants.MIRRORS.values() for alias in aliases}
+        for key in self.mirror:
+            if key in valid_aliases:
                 continue
             raise ConfigValidationError(f"Invalid mirror key: {key}, must be one of {constants.MIRRORS.values()}.")
         
@@ -174,64 +225,12 @@ class ConfigModel(BaseModel):
     @model_validator(mode='after')
     def validate_cross_references_and_cycles(self) -> 'ConfigModel':
         """Check if ref-chains a circle"""
-        images_by_name = self.images
-        defined_image_names = set(images_by_name.keys())
-        
-        visiting: Set[str] = set()
-        visited: Set[str] = set()
-
-        def detect_image_cycle(name: str):
-            logger.debug(f"[Validation] Checking image '{name}' for cycles...")
-            visiting.add(name)
-            image_conf = images_by_name[name]
-            
-            if image_conf.ref and ':' not in image_conf.ref:
-                ref_name = image_conf.ref
-                # DEBUG: Log the reference being followed
-                logger.debug(f"[Validation] Image '{name}' has ref to '{ref_name}'. Following reference.")
-                if ref_name not in defined_image_names:
-                    raise ReferenceNotFoundError(f"Image '{name}' has a 'ref' to an undefined image: '{ref_name}'.")
-                if ref_name in visiting:
-                    raise CircularDependencyError(f"Circular dependency in images: '{name}' -> '{ref_name}' forms a loop.")
-                if ref_name not in visited:
-                    detect_image_cycle(ref_name)
-            
-            visiting.remove(name)
-            visited.add(name)
-            logger.debug(f"[Validation] Image '{name}' passed cycle check.")
-
         logger.debug("Starting image dependency and cycle validation...")
-        for name in defined_image_names:
-            if name not in visited:
-                detect_image_cycle(name)
+        _check_ref_cycles(self.images, "image")
         logger.debug("Image validation completed successfully.")
 
-        builds_by_name = self.builds
-        defined_build_names = set(builds_by_name.keys())
-        visiting.clear()
-        visited.clear()
-        def detect_build_cycle(name: str):
-            logger.debug(f"[Validation] Checking build '{name}' for cycles...")
-            visiting.add(name)
-            build_conf = builds_by_name[name]
-            if build_conf.ref and ':' not in build_conf.ref:
-                ref_name = build_conf.ref
-                logger.debug(f"[Validation] Build '{name}' has ref to '{ref_name}'. Following reference.")
-                if ref_name not in defined_build_names:
-                    raise ReferenceNotFoundError(f"Build '{name}' has a 'ref' to an undefined build: '{ref_name}'.")
-                if ref_name in visiting:
-                    raise CircularDependencyError(f"Circular dependency in builds: '{name}' -> '{ref_name}' forms a loop.")
-                if ref_name not in visited:
-                    detect_build_cycle(ref_name)
-            
-            visiting.remove(name)
-            visited.add(name)
-            logger.debug(f"[Validation] Build '{name}' passed cycle check.")
-
         logger.debug("Starting build dependency and cycle validation...")
-        for name in defined_build_names:
-            if name not in visited:
-                detect_build_cycle(name)
+        _check_ref_cycles(self.builds, "build")
         logger.debug("Build validation completed successfully.")
         
         return self
@@ -275,7 +274,7 @@ class Config:
     def _load_raw_config(self) -> Dict[str, Any]:
         try:
             content = self.fs.read_text(DNSBPath(self.path))
-            config_data = yaml.safe_load(content)
+            config_data = yaml.load(content, Loader=_YAML_LOADER)
             if not isinstance(config_data, dict):
                 raise ConfigParsingError("Configuration file must be a YAML document containing a dictionary.")
             logger.debug(f"Successfully parsed YAML from '{self.path}'.")
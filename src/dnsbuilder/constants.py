@@ -21,7 +21,7 @@ LOG_ALIAS_MAP = {
     "conf": "dnsbuilder.config",
     "api": "dnsbuilder.api",
     "pre": "dnsbuilder.preprocess",
-    "cbld": "dnsbuilder.builder.cached_builder",
+    "cbld": "dnsbuilder.cache.build",
     "cache": "dnsbuilder.cache",
     "cc": "dnsbuilder.cache",
     "rty": "dnsbuilder.registry",
@@ -59,7 +59,7 @@ STD_BUILD_PREFIX = "std:"
 
 # DNS Software Top-level Block Definitions
 DNS_SOFTWARE_BLOCKS = {
-    "bind": {
+    "bind": frozenset({
         "global",
         "acl",          # Access Control Lists
         "controls",     # Control channel configuration
@@ -72,8 +72,8 @@ DNS_SOFTWARE_BLOCKS = {
         "trusted-keys", # Trusted keys for DNSSEC
         "managed-keys", # Managed keys for DNSSEC
         "statistics-channels", # Statistics channel configuration
-    },
-    "unbound": {
+    }),
+    "unbound": frozenset({
         "global",
         "server",           # Main server configuration
         "remote-control",   # Remote control configuration
@@ -83,16 +83,16 @@ DNS_SOFTWARE_BLOCKS = {
         "view",             # View configuration
         "python",           # Python module configuration
         "dynlib",           # Dynamic library configuration
-    },
-    "pdns_recursor": {
+    }),
+    "pdns_recursor": frozenset({
         "global",           # PowerDNS Recursor only has global configuration
-    },
-    "knot_resolver": {
+    }),
+    "knot_resolver": frozenset({
         "global",
-    },
-    "knot_resolver6": {
+    }),
+    "knot_resolver6": frozenset({
         "global",
-    }
+    })
 }
 
 RECOGNIZED_PATTERNS = {
@@ -125,7 +125,7 @@ RECOGNIZED_PATTERNS = {
 
 # --- Behavior Sections ---
 
-BEHAVIOR_TYPES = {"Forward", "Stub", "Master", "Hint"}
+BEHAVIOR_TYPES = frozenset({"Forward", "Stub", "Master", "Hint"})
 
 class BehaviorSection(str, Enum):
     SERVER = "server"
@@ -168,7 +168,7 @@ ALIAS_MAP = {
 }
 
 # --- supported protocol ---
-KNOWN_PROTOCOLS = {"http", "https", "ftp", "s3", "gs", "file", "resource", "temp", "git", "cache", "raw", "key"}
+KNOWN_PROTOCOLS = frozenset({"http", "https", "ftp", "s3", "gs", "file", "resource", "temp", "git", "cache", "raw", "key"})
 
 # --- Docker Compose Keys & Values ---
 DEFAULT_CAP_ADD = ["NET_ADMIN"]
@@ -176,9 +176,9 @@ DEFAULT_NETWORK_NAME = "app_net"
 DEFAULT_DEVICE_NAME = "bridge"
 
 # --- Reserved Keys in Build Configs ---
-RESERVED_BUILD_KEYS = {'image', 'volumes', 'cap_add', 'address', 'ref', 'behavior', 'build', 'mixins', 'mounts', 'files', 'auto', 'extra_conf', 'mirror', 'dnssec', 'vars'}
+RESERVED_BUILD_KEYS = frozenset({'image', 'volumes', 'cap_add', 'address', 'ref', 'behavior', 'build', 'mixins', 'mounts', 'files', 'auto', 'extra_conf', 'mirror', 'dnssec', 'vars'})
 
-RESERVED_CONFIG_KEYS = {'name', 'inet', 'images', 'builds', 'include', 'auto', 'mirror', 'vars', 'plugins'}
+RESERVED_CONFIG_KEYS = frozenset({'name', 'inet', 'images', 'builds', 'include', 'auto', 'mirror', 'vars', 'plugins'})
 
 # -- Config constants ---
 MIRRORS = { 
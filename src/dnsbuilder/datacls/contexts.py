@@ -5,6 +5,7 @@ This module contains the BuildContext data class, which holds all state
 for a build run. It uses Protocol types to avoid circular dependencies.
 """
 
+import time
 from pydantic import BaseModel, ConfigDict, Field, model_validator
 from typing import Dict, Optional, Any
 
@@ -35,6 +36,9 @@ class BuildContext(BaseModel):
     service_ips: Dict[str, str] = Field(default_factory=dict)
     reserved_ips: Dict[str, str] = Field(default_factory=dict)
 
+    # SOA serial shared by every zone generated in this build
+    build_serial: int = Field(default_factory=lambda: int(time.time()))
+
     @model_validator(mode="after")
     def init_dependent_factories(self) -> "BuildContext":
         """Initialize includer factory if not provided"""
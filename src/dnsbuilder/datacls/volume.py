@@ -4,6 +4,8 @@ from .. import constants
 from ..io.path import DNSBPath, is_path_valid
 from ..exceptions import VolumeError
 
+_MODES = frozenset(("ro", "rw"))
+
 class Pair(NamedTuple):
     """
         Class Pair to describe a volume pair
@@ -53,9 +55,14 @@ class Volume:
         if self.origin_volume.startswith(constants.PLACEHOLDER["ORIGIN"]):
             self.is_origin = True
             self.origin_volume = self.origin_volume[len(constants.PLACEHOLDER["ORIGIN"]):]
-        args, last = self.origin_volume.rsplit(':', 1)
-        if last in ['ro', 'rw']:
-            src, dst, self.mode = self.origin_volume.rsplit(':', 2)
+        parts = self.origin_volume.rsplit(':', 2)
+        if len(parts) < 2:
+            raise VolumeError(f"Invalid volume format: {self.origin_volume}, we expect src:dst[:mode]")
+        last = parts[-1]
+        if last in _MODES:
+            if len(parts) < 3:
+                raise VolumeError(f"Invalid volume format: {self.origin_volume}, we expect src:dst[:mode]")
+            src, dst, self.mode = parts
             if self.__check_required(src):
                 self.is_required = True
                 self.src = None
@@ -63,6 +70,7 @@ class Volume:
                 self.src = DNSBPath(src, is_origin=self.is_origin)
             self.dst = DNSBPath(dst)
         elif is_path_valid(last):
+            args = parts[0] if len(parts) == 2 else f"{parts[0]}:{parts[1]}"
             if self.__check_required(args):
                 self.is_required = True
                 self.src = None
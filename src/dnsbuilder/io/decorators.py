@@ -53,7 +53,7 @@ def wrap_io_error(func, ignores: Tuple[Type[Exception], ...] = ()):
     return wrapper
 
 WRITE_METHODS = [
-    'write_text', 'write_bytes', 'append_text', 'append_bytes',
+    'write_text', 'write_bytes', 'write_many', 'append_text', 'append_bytes',
     'mkdir', 'rmtree', 'remove', 'copy', 'copytree'
 ]
 
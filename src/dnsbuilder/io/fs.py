@@ -1,6 +1,6 @@
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import Dict, List, IO, NamedTuple
+from typing import Any, Callable, Dict, Iterable, Iterator, List, IO, NamedTuple, Tuple, Union
 from datetime import datetime, timezone
 import logging
 import os
@@ -114,6 +114,39 @@ class FileSystem(ABC):
         """Remove a directory recursively"""
         pass
 
+    def write_many(self, items: Iterable[Tuple[DNSBPath, str]]):
+        """
+        Write several text files in one call.
+        Handlers override this to amortize per-file setup; the default writes one by one.
+        """
+        for path, content in items:
+            self.write_text(path, content)
+
+    def walk(self, path: DNSBPath) -> Iterator[Tuple[DNSBPath, List[str], List[str]]]:
+        """
+        Walk a directory tree top-down like os.walk, yielding (dirpath, dirnames, filenames).
+        Remove names from dirnames in place to skip descending into them.
+        """
+        dirnames, filenames = [], []
+        for child in self.listdir(path):
+            (dirnames if self.is_dir(child) else filenames).append(child.name)
+        yield path, dirnames, filenames
+        for name in dirnames:
+            yield from self.walk(path / name)
+
+    def hash_file(self, path: DNSBPath, algorithm: Union[str, Callable[[], Any]] = "sha256") -> str:
+        """
+        Hex digest of a file's content, hashed in chunks instead of read whole into memory.
+        `algorithm` is a hashlib name or a constructor of a hashlib-compatible object.
+        """
+        f = self.open(path, "rb")
+        if f is NotImplemented:
+            digest = hashlib.new(algorithm) if isinstance(algorithm, str) else algorithm()
+            digest.update(self.read_bytes(path))
+            return digest.hexdigest()
+        with f:
+            return hashlib.file_digest(f, algorithm).hexdigest()
+
     # Helper methods for path conversion
     def str2path(self, path_str: str, base_path: DNSBPath) -> DNSBPath:
         """
@@ -322,6 +355,18 @@ class AppFileSystem(FileSystem):
     def write_bytes(self, path: DNSBPath, content: bytes):
         return self._delegate("write_bytes", path, content)
 
+    @override
+    @wrap_io_error
+    def write_many(self, items: Iterable[Tuple[DNSBPath, str]]):
+        # Group by handler so each one gets a single batch
+        batches: Dict[int, Tuple[FileSystem, List[Tuple[DNSBPath, str]]]] = {}
+        for path, content in items:
+            resolved_path = self._resolve_path(path)
+            handler = self._get_handler(resolved_path)
+            batches.setdefault(id(handler), (handler, []))[1].append((resolved_path, content))
+        for handler, batch in batches.values():
+            handler.write_many(batch)
+
     @override
     @wrap_io_error
     def append_text(self, path: DNSBPath, content: str):
@@ -397,6 +442,15 @@ class AppFileSystem(FileSystem):
     def open(self, path: DNSBPath, mode: str = "rb", **kwargs) -> IO:
         return self._delegate("open", path, mode, **kwargs)
 
+    @override
+    @wrap_io_error
+    def hash_file(self, path: DNSBPath, algorithm: Union[str, Callable[[], Any]] = "sha256") -> str:
+        return self._delegate("hash_file", path, algorithm)
+
+    @override
+    def walk(self, path: DNSBPath) -> Iterator[Tuple[DNSBPath, List[str], List[str]]]:
+        return self._delegate("walk", path)
+
     @override
     def fallback(self, enable: bool):
         handler = self._handlers.get("file")
@@ -559,6 +613,11 @@ class SandboxFileSystem(FileSystem):
         logger.debug(f"[{self.name}] Writing bytes to primary: {path}")
         self.primary.write_bytes(path, content)
 
+    @override
+    def write_many(self, items: Iterable[Tuple[DNSBPath, str]]):
+        logger.debug(f"[{self.name}] Writing batch to primary")
+        self.primary.write_many(items)
+
     @override
     def append_text(self, path: DNSBPath, content: str):
         logger.debug(f"[{self.name}] Appending text to primary: {path}")
@@ -615,10 +674,11 @@ class SandboxFileSystem(FileSystem):
         """
         Lists directory contents, merging results from primary and secondary.
         """
+        # Handlers are not wrapped, so a missing directory may surface as FileNotFoundError
         primary_names = set()
         try:
             primary_names.update(p.name for p in self.primary.listdir(path))
-        except DNSBPathNotFoundError:
+        except (DNSBPathNotFoundError, FileNotFoundError):
             # If dir doesn't exist in primary, that's fine, we might find it in secondary
             if not self.fb_en or not self.secondary.is_dir(path):
                 raise
@@ -629,7 +689,7 @@ class SandboxFileSystem(FileSystem):
         secondary_names = set()
         try:
             secondary_names.update(p.name for p in self.secondary.listdir(path))
-        except DNSBPathNotFoundError:
+        except (DNSBPathNotFoundError, FileNotFoundError):
             if not primary_names:
                 raise
         all_names = primary_names.union(secondary_names)
@@ -692,6 +752,13 @@ class SandboxFileSystem(FileSystem):
                     
         return list(results.values())
 
+    @override
+    def walk(self, path: DNSBPath) -> Iterator[Tuple[DNSBPath, List[str], List[str]]]:
+        if not self.fb_en:
+            return self.primary.walk(path)
+        # Merged view: walk through listdir/is_dir, which consult both layers
+        return super().walk(path)
+
     @override
     def absolute(self, path: DNSBPath) -> DNSBPath:
         """Returns the absolute path, calculated relative to the primary filesystem."""
@@ -821,6 +888,19 @@ class GenericFileSystem(FileSystem, ABC):
         with self.fs.open(self.path2str(path), "wb") as f:
             f.write(content)
 
+    @override
+    def write_many(self, items: Iterable[Tuple[DNSBPath, str]], encoding: str = "utf-8"):
+        created = set()
+        for path, content in items:
+            logger.debug(f"[{self.name}] Writing to: {path}")
+            parent = self.path2str(path.parent)
+            # Sibling files share a parent; create it once per batch
+            if parent not in created:
+                self.fs.mkdirs(parent, exist_ok=True)
+                created.add(parent)
+            with self.fs.open(self.path2str(path), "w", encoding=encoding) as f:
+                f.write(content)
+
     @override
     def append_text(self, path: DNSBPath, content: str, encoding: str = "utf-8"):
         logger.debug(f"[{self.name}] Appending to: {path}")
@@ -877,6 +957,17 @@ class GenericFileSystem(FileSystem, ABC):
     def remove(self, path: DNSBPath):
         self.fs.rm(self.path2str(path))
 
+    @override
+    def walk(self, path: DNSBPath) -> Iterator[Tuple[DNSBPath, List[str], List[str]]]:
+        # One detailed listing per directory; entry types come with it, no per-entry is_dir
+        dirnames, filenames = [], []
+        for info in self.fs.ls(self.path2str(path), detail=True):
+            name = info["name"].rstrip("/").rsplit("/", 1)[-1]
+            (dirnames if info.get("type") == "directory" else filenames).append(name)
+        yield path, dirnames, filenames
+        for name in dirnames:
+            yield from self.walk(path / name)
+
     @override
     def glob(self, path: DNSBPath, pattern: str) -> List[DNSBPath]:
         return [self.str2path(p, path) for p in self.fs.glob(self.path2str(path / pattern))]
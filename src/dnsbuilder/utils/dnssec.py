@@ -5,8 +5,21 @@ Provides helper functions to extract DNSSEC configuration values from build conf
 supporting both legacy boolean format and new structured format with hooks support.
 """
 
+import atexit
+import os
+import shutil
+import tempfile
+import threading
 from typing import Union, List, Dict, Any, Tuple, Optional
 
+# RAM-backed tmpfs on Linux; keeps dnssec-keygen / dnssec-signzone file I/O in memory
+SHM_DIR = "/dev/shm"
+
+# Services build on a thread pool, so the shared signing root is created under a lock
+_signing_tmp_lock = threading.Lock()
+_signing_tmp_root: Optional[str] = None
+_signing_tmp_ready = False
+
 
 def get_dnssec_config(build_conf: Dict[str, Any]) -> Tuple[bool, List[str], Dict[str, Any]]:
     """
@@ -59,6 +72,19 @@ def is_dnssec_enabled(build_conf: Dict[str, Any]) -> bool:
     return enable
 
 
+def is_dnssec_key_reuse_enabled(build_conf: Dict[str, Any]) -> bool:
+    """
+    Check if generated DNSSEC keys should be reused across builds.
+
+    Only the structured format can enable it (dnssec: {enable: true, reuse_keys: true}).
+
+    Args:
+        build_conf: The build configuration dictionary
+    """
+    dnssec_config = build_conf.get('dnssec', False)
+    return isinstance(dnssec_config, dict) and dnssec_config.get('reuse_keys', False) is True
+
+
 def get_dnssec_includes(build_conf: Dict[str, Any]) -> List[str]:
     """
     Get list of files to include for DNSSEC records.
@@ -113,3 +139,36 @@ def get_dnssec_hook(build_conf: Dict[str, Any], hook_name: str) -> Optional[str]
     """
     hooks = get_dnssec_hooks(build_conf)
     return hooks.get(hook_name)
+
+
+def get_signing_tmp_root() -> Optional[str]:
+    """
+    Get the directory under which per-zone signing work directories are created.
+
+    A single directory on /dev/shm is created on first use and removed at exit,
+    so signing tools read and write tmpfs instead of the default temp location
+    (often a slow overlay filesystem inside containers). Safe to call from
+    concurrent zone generators; the directory is created exactly once.
+
+    Returns:
+        Path of the signing temp root, or None to use the default temp location
+    """
+    global _signing_tmp_root, _signing_tmp_ready
+    if _signing_tmp_ready:
+        return _signing_tmp_root
+    with _signing_tmp_lock:
+        if not _signing_tmp_ready:
+            _signing_tmp_root = _create_signing_tmp_root()
+            _signing_tmp_ready = True
+    return _signing_tmp_root
+
+
+def _create_signing_tmp_root() -> Optional[str]:
+    if not (os.path.isdir(SHM_DIR) and os.access(SHM_DIR, os.W_OK | os.X_OK)):
+        return None
+    try:
+        root = tempfile.mkdtemp(prefix="dnsb-dnssec-", dir=SHM_DIR)
+    except OSError:
+        return None
+    atexit.register(shutil.rmtree, root, ignore_errors=True)
+    return root
@@ -1,6 +1,7 @@
 """Zone utilities for DNS operations."""
 
 from dataclasses import dataclass
+from functools import cached_property
 from typing import Optional, Tuple
 
 
@@ -23,7 +24,7 @@ class Zone:
     Unified zone handling for DNS operations.
 
     Stores domain as parts (labels from left to right).
-    Derives FQDN and label formats on demand.
+    Derives FQDN, label and filename formats on first access and caches them.
 
     Examples:
         >>> zone = Zone("example.com")
@@ -81,21 +82,21 @@ class Zone:
         """Get FQDN format (e.g., 'example.com.', '.' for root)."""
         return self.fqdn
 
-    @property
+    @cached_property
     def fqdn(self) -> str:
         """Get FQDN format (e.g., 'example.com.', '.' for root)."""
         if self.is_root:
             return "."
         return ".".join(self.parts) + "."
 
-    @property
+    @cached_property
     def label(self) -> str:
         """Get label format (e.g., 'example.com', 'root' for root)."""
         if self.is_root:
             return "root"
         return ".".join(self.parts)
 
-    @property
+    @cached_property
     def filename(self) -> str:
         """Get the base filename for this zone (e.g., 'db.example.com')."""
         return f"db.{self.label}"
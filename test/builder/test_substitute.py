@@ -0,0 +1,241 @@
+# tests/builder/test_substitute.py
+
+import copy
+from collections import OrderedDict
+from enum import Enum
+from types import SimpleNamespace
+
+import pytest
+
+from dnsbuilder.builder.substitute import _SERVICE_FIELD_RE, VariableSubstitutor
+from dnsbuilder.exceptions import BuildError
+
+class Mode(str, Enum):
+    AUTH = "auth-${name}"
+    PLAIN = "plain"
+
+
+class Labels(list):
+    """List subclass, as config loaders may produce."""
+
+
+BUILDS = {
+    "auth": {
+        "image": "bind",
+        "peer": "recursor",
+        "greeting": "hello ${name}",
+        "chain": "${greeting}!",
+        "same": "${same}",
+        "loop": "again ${loop}",
+        "ping": "${pong}",
+        "pong": "${ping}",
+    },
+    "recursor": {"image": "bind", "port": 5353},
+}
+
+
+@pytest.fixture
+def substitutor():
+    config = SimpleNamespace(
+        name="demo",
+        inet="10.0.0.0/24",
+        builds_config=BUILDS,
+        model=SimpleNamespace(vars={"zone": "example.com"}),
+    )
+    images = {"bind": SimpleNamespace(name="bind", software="bind", version="9.18.0")}
+    return VariableSubstitutor(
+        config, images, {"auth": "10.0.0.2", "recursor": "10.0.0.3", "ns.v2": "10.0.0.4"}, {}, BUILDS,
+    )
+
+
+@pytest.fixture
+def expand(substitutor):
+    var_map = substitutor._map("auth", BUILDS["auth"])
+    return lambda text: substitutor._expand(text, var_map)
+
+
+class TestExpand:
+    """Tests for single-pass `${...}` expansion."""
+
+    @pytest.mark.parametrize(
+        "text, expected",
+        [
+            ("${name}", "auth"),
+            ("${name}-${ip}", "auth-10.0.0.2"),
+            ("${project.name}/${vars.zone}", "demo/example.com"),
+            ("no references", "no references"),
+            # Nested references resolve innermost first
+            ("${services.${peer}.ip}", "10.0.0.3"),
+            ("${services.${services.auth.peer}.port}", "5353"),
+            # Resolved values are expanded in place, also transitively
+            ("${greeting}", "hello auth"),
+            ("[${chain}]", "[hello auth!]"),
+        ],
+    )
+    def test_references(self, expand, text, expected):
+        assert expand(text) == expected
+
+    @pytest.mark.parametrize(
+        "text, expected",
+        [
+            ("${does.not.exist}", "none"),
+            ("${does.not.exist:fallback}", "fallback"),
+            ("${services.ghost.ip}", "none"),
+            ("${services.ghost.ip:127.0.0.1}", "127.0.0.1"),
+        ],
+    )
+    def test_unknown_references(self, expand, text, expected):
+        assert expand(text) == expected
+
+    @pytest.mark.parametrize("text", ["${required}", "${origin}", "key ${required};"])
+    def test_placeholders_are_kept(self, expand, text):
+        assert expand(text) == text
+
+    @pytest.mark.parametrize(
+        "text, expected",
+        [
+            ("options { directory \"/var\"; };", "options { directory \"/var\"; };"),
+            ("zone \"${name}\" { type master; };", "zone \"auth\" { type master; };"),
+            ("{{${name}}}", "{{auth}}"),
+            ("} stray { braces", "} stray { braces"),
+            ("${}", "${}"),
+            ("${a{b}c}", "${a{b}c}"),
+        ],
+    )
+    def test_literal_braces(self, expand, text, expected):
+        assert expand(text) == expected
+
+    @pytest.mark.parametrize(
+        "text, expected",
+        [
+            ("${name", "${name"),
+            ("${name} ${oops", "auth ${oops"),
+            ("${services.${peer}.ip", "${services.recursor.ip"),
+            ("$name}", "$name}"),
+        ],
+    )
+    def test_unterminated_references_are_kept(self, expand, text, expected):
+        assert expand(text) == expected
+
+    @pytest.mark.parametrize("text", ["${loop}", "x ${loop} y", "${ping}", "${pong}"])
+    def test_cycles_raise(self, expand, text):
+        with pytest.raises(BuildError, match="Circular variable reference"):
+            expand(text)
+
+    def test_reference_to_itself_is_kept(self, expand):
+        # Indistinguishable from a value kept for a later stage (see no_required)
+        assert expand("${same}") == "${same}"
+
+    def test_cycle_raises_from_run(self, substitutor):
+        with pytest.raises(BuildError, match="Circular variable reference"):
+            substitutor.run({"builds": {"auth": {"conf": "${ping}"}}})
+
+    def test_same_reference_twice_is_not_a_cycle(self, expand):
+        assert expand("${greeting} ${greeting}") == "hello auth hello auth"
+
+
+class TestRecursive:
+    """Tests for substitution over nested config structures."""
+
+    def test_nested_structures(self, substitutor):
+        var_map = substitutor._map("auth", BUILDS["auth"])
+        item = {
+            "name": "${name}",
+            "ports": [53, "${services.recursor.port}", {"tls": "${ip}:853"}],
+            "nested": {"deep": [["${project.name}", None, True, 1.5]]},
+            "pair": ("${name}", ["${ip}"]),
+            "${name}": "keys are not substituted",
+        }
+        original = copy.deepcopy(item)
+
+        result = substitutor._recursive(item, var_map)
+
+        assert result == {
+            "name": "auth",
+            "ports": [53, "5353", {"tls": "10.0.0.2:853"}],
+            "nested": {"deep": [["demo", None, True, 1.5]]},
+            # Tuples are kept as-is, as before the iterative walk
+            "pair": ("${name}", ["${ip}"]),
+            "${name}": "keys are not substituted",
+        }
+        assert item == original
+        assert result["ports"] is not item["ports"]
+
+    def test_subclasses_are_walked(self, substitutor):
+        var_map = substitutor._map("auth", BUILDS["auth"])
+        item = OrderedDict(mode=Mode.AUTH, plain=Mode.PLAIN, labels=Labels(["${name}", Mode.AUTH]))
+
+        result = substitutor._recursive(item, var_map)
+
+        assert result == {"mode": "auth-auth", "plain": "plain", "labels": ["auth", "auth-auth"]}
+        assert result["plain"] is Mode.PLAIN
+
+    @pytest.mark.parametrize(
+        "item, expected",
+        [(None, None), (0, 0), (2.5, 2.5), (False, False), ("${name}", "auth"), (["${name}"], ["auth"])],
+    )
+    def test_top_level_values(self, substitutor, item, expected):
+        var_map = substitutor._map("auth", BUILDS["auth"])
+
+        assert substitutor._recursive(item, var_map) == expected
+
+
+class TestResolveService:
+    """Tests for `services.<svc>.<field>` references."""
+
+    @pytest.mark.parametrize(
+        "rest, kind, fields",
+        [
+            ("recursor.ip", "ip", {"ip": "recursor"}),
+            ("ns.v2.ip", "ip", {"ip": "ns.v2"}),
+            ("recursor.image.ip", "ip", {"ip": "recursor.image"}),
+            (".ip", "ip", {"ip": ""}),
+            ("recursor.image.version", "prop", {"svc": "recursor", "prop": "version"}),
+            ("recursor.image.version.extra", "prop", {"svc": "recursor", "prop": "version"}),
+            ("recursor.image.", "prop", {"svc": "recursor", "prop": ""}),
+            ("ns.v2.image.version", "bad", {}),
+            ("image.version", "bad", {}),
+        ],
+    )
+    def test_field_classification(self, rest, kind, fields):
+        match = _SERVICE_FIELD_RE.fullmatch(rest)
+
+        assert match is not None and match.lastgroup == kind
+        assert {name: match[name] for name in fields} == fields
+
+    @pytest.mark.parametrize("rest", ["recursor", "recursor.port", "recursor.ipv6", "ip", "myimage.version", ""])
+    def test_other_fields_are_not_service_references(self, substitutor, rest):
+        assert _SERVICE_FIELD_RE.fullmatch(rest) is None
+        assert substitutor._resolve_service(f"services.{rest}", rest) is None
+
+    @pytest.mark.parametrize(
+        "text, expected",
+        [
+            ("${services.recursor.ip}", "10.0.0.3"),
+            ("${services.ns.v2.ip}", "10.0.0.4"),
+            ("${services.recursor.address}", "10.0.0.3"),
+            ("${services.recursor.image.version}", "9.18.0"),
+            ("${services.recursor.image.software.ignored}", "bind"),
+            # Unknown fields fall through to the other service's build config
+            ("${services.recursor.port}", "5353"),
+            ("${services.recursor.nope}", "none"),
+            ("${services.recursor.nope:fb}", "fb"),
+        ],
+    )
+    def test_references(self, expand, text, expected):
+        assert expand(text) == expected
+
+    @pytest.mark.parametrize(
+        "text",
+        [
+            "${services.recursor.image.missing}",
+            "${services.recursor.image.}",
+            "${services.ns.v2.image.version}",
+            "${services.image.version}",
+            "${services.recursor.image.ip}",
+            "${services..ip}",
+        ],
+    )
+    def test_malformed_references(self, expand, text):
+        assert expand(text) == "none"
+        assert expand(text[:-1] + ":fb}") == "fb"
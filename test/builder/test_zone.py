@@ -0,0 +1,205 @@
+# tests/builder/test_zone.py
+
+import shutil
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+from dnslib import RR, A, QTYPE
+
+from dnsbuilder.builder.zone import ZoneGenerator
+from dnsbuilder.io import DNSBPath, create_app_fs
+
+
+class ThreadRecordingFS:
+    """Proxies a file system and records which threads call into it."""
+
+    def __init__(self, fs):
+        self._fs = fs
+        self.threads = set()
+
+    def __getattr__(self, name):
+        attr = getattr(self._fs, name)
+        if not callable(attr):
+            return attr
+
+        def call(*args, **kwargs):
+            self.threads.add(threading.current_thread())
+            return attr(*args, **kwargs)
+        return call
+
+
+@pytest.fixture
+def app_fs(tmp_path):
+    return create_app_fs(chroot=DNSBPath(str(tmp_path)), cache_root=DNSBPath(str(tmp_path / ".dnsb_cache")))
+
+
+def make_context(fs, service_name="auth"):
+    return SimpleNamespace(fs=fs, service_ips={service_name: "10.0.0.2"}, build_serial=2024010101)
+
+
+def make_generator(context, zone, service_name="auth", build_conf=None):
+    records = [RR(rname=f"www.{zone}.", rtype=QTYPE.A, rdata=A("10.0.0.3"), ttl=300)]
+    build_conf = build_conf if build_conf is not None else {"dnssec": True}
+    return ZoneGenerator(context, zone, service_name, records, enable_dnssec=True, build_conf=build_conf)
+
+
+class TestZoneGeneratorConcurrentSigning:
+    """Tests for signing several zones of one service concurrently."""
+
+    def test_filesystem_stays_on_calling_thread(self, app_fs, monkeypatch):
+        sign_threads = set()
+
+        def fake_sign_zone(self, unsigned_content, keys=None):
+            sign_threads.add(threading.current_thread())
+            time.sleep(0.01)
+            return ("ksk", "zsk", f"ds {self.zone.fqdn}", "ksk-private", "zsk-private",
+                    f"K{self.zone.fqdn}+013+1", f"K{self.zone.fqdn}+013+2",
+                    f"{unsigned_content}\n; signed")
+
+        monkeypatch.setattr(ZoneGenerator, "_sign_zone", fake_sign_zone)
+        fs = ThreadRecordingFS(app_fs)
+        context = make_context(fs)
+        zones = ["a.test", "b.test", "c.test", "d.test"]
+        generators = [make_generator(context, zone) for zone in zones]
+
+        results = ZoneGenerator.generate_concurrently(generators, max_workers=4)
+
+        assert fs.threads == {threading.current_thread()}
+        assert threading.current_thread() not in sign_threads
+        assert len(results) == len(zones)
+        for zone, artifacts in zip(zones, results):
+            signed, unsigned = artifacts
+            assert signed.is_primary and signed.filename == f"db.{zone}"
+            assert signed.content == f"{unsigned.content}\n; signed"
+            assert app_fs.read_text(DNSBPath(f"temp:/services/auth/zones/db.{zone}")) == signed.content
+            assert app_fs.read_text(DNSBPath(f"key:/auth/{zone}.ds")) == f"ds {zone}."
+
+    def test_matches_serial_generation(self, app_fs, monkeypatch):
+        def fake_sign_zone(self, unsigned_content, keys=None):
+            return ("ksk", "zsk", "", "ksk-private", "zsk-private", "Kksk", "Kzsk", unsigned_content + "\n; signed")
+
+        monkeypatch.setattr(ZoneGenerator, "_sign_zone", fake_sign_zone)
+        context = make_context(app_fs)
+        zones = ["a.test", "b.test", "c.test"]
+
+        serial = [make_generator(context, zone).generate() for zone in zones]
+        concurrent = ZoneGenerator.generate_concurrently([make_generator(context, zone) for zone in zones], max_workers=3)
+
+        assert concurrent == serial
+
+    def test_failed_zone_falls_back_to_unsigned(self, app_fs, monkeypatch):
+        def fake_sign_zone(self, unsigned_content, keys=None):
+            if self.zone.fqdn == "bad.test.":
+                return None
+            return ("ksk", "zsk", "", "ksk-private", "zsk-private", "Kksk", "Kzsk", unsigned_content + "\n; signed")
+
+        monkeypatch.setattr(ZoneGenerator, "_sign_zone", fake_sign_zone)
+        context = make_context(app_fs)
+        generators = [make_generator(context, zone) for zone in ["good.test", "bad.test"]]
+
+        good, bad = ZoneGenerator.generate_concurrently(generators, max_workers=2)
+
+        assert [artifact.filename for artifact in good] == ["db.good.test", "db.good.test.unsigned"]
+        assert len(bad) == 1 and bad[0].is_primary and "; signed" not in bad[0].content
+        assert not app_fs.exists(DNSBPath("key:/auth/bad.test.ksk.key"))
+
+    @pytest.mark.skipif(shutil.which("dnssec-signzone") is None, reason="BIND DNSSEC tools not installed")
+    def test_signs_multiple_zones_with_dnssec_tools(self, app_fs):
+        context = make_context(app_fs)
+        zones = ["a.test", "b.test", "c.test"]
+        generators = [make_generator(context, zone) for zone in zones]
+
+        results = ZoneGenerator.generate_concurrently(generators, max_workers=3)
+
+        for zone, artifacts in zip(zones, results):
+            signed = artifacts[0]
+            assert signed.is_primary and "RRSIG" in signed.content
+            assert app_fs.read_text(DNSBPath(f"key:/auth/{zone}.ksk.private"))
+            assert app_fs.read_text(DNSBPath(f"key:/auth/{zone}.keynames")).startswith("KSK_BASENAME=")
+
+
+class TestZoneKeyReuse:
+    """Tests for reusing generated DNSSEC keys across builds (dnssec.reuse_keys)."""
+
+    KEYS = ("ksk-key", "ksk-private", "zsk-key", "zsk-private", "Kreuse.test.+013+1", "Kreuse.test.+013+2")
+    REUSE = {"dnssec": {"enable": True, "reuse_keys": True}}
+
+    def test_disabled_by_default(self, app_fs, tmp_path):
+        generator = make_generator(make_context(app_fs), "reuse.test")
+
+        generator._store_zone_keys(self.KEYS)
+
+        assert generator._zone_keys_path() is None
+        assert generator._load_zone_keys() is None
+        assert not (tmp_path / ".dnsb_cache" / "keys").exists()
+
+    def test_disabled_with_hooks(self, app_fs):
+        build_conf = {"dnssec": {"enable": True, "reuse_keys": True, "hooks": {"pre": "pass"}}}
+        generator = make_generator(make_context(app_fs), "reuse.test", build_conf=build_conf)
+
+        assert generator._zone_keys_path() is None
+
+    def test_reuses_stored_keys(self, app_fs):
+        context = make_context(app_fs)
+        make_generator(context, "reuse.test", build_conf=self.REUSE)._store_zone_keys(self.KEYS)
+
+        assert make_generator(context, "reuse.test", build_conf=self.REUSE)._load_zone_keys() == self.KEYS
+        assert make_generator(context, "other.test", build_conf=self.REUSE)._load_zone_keys() is None
+
+    def test_key_file_is_owner_only(self, app_fs, tmp_path):
+        generator = make_generator(make_context(app_fs), "reuse.test", build_conf=self.REUSE)
+
+        generator._store_zone_keys(self.KEYS)
+
+        (key_file,) = (tmp_path / ".dnsb_cache" / "keys").iterdir()
+        assert key_file.stat().st_mode & 0o777 == 0o600
+
+    def test_expired_keys_are_rolled_over(self, app_fs, monkeypatch):
+        generator = make_generator(make_context(app_fs), "reuse.test", build_conf=self.REUSE)
+        generator._store_zone_keys(self.KEYS)
+
+        now = time.time()
+        monkeypatch.setattr(time, "time", lambda: now + ZoneGenerator.KEY_CACHE_TTL - 60)
+        assert generator._load_zone_keys() == self.KEYS
+        monkeypatch.setattr(time, "time", lambda: now + ZoneGenerator.KEY_CACHE_TTL + 60)
+        assert generator._load_zone_keys() is None
+
+    def test_generate_signs_with_keys_of_earlier_build(self, app_fs, monkeypatch):
+        used_keys = []
+
+        def fake_sign_zone(self, unsigned_content, keys=None):
+            used_keys.append(keys)
+            ksk_key, ksk_private, zsk_key, zsk_private, ksk_basename, zsk_basename = keys or TestZoneKeyReuse.KEYS
+            return (ksk_key, zsk_key, "", ksk_private, zsk_private, ksk_basename, zsk_basename, unsigned_content)
+
+        monkeypatch.setattr(ZoneGenerator, "_sign_zone", fake_sign_zone)
+        context = make_context(app_fs)
+
+        make_generator(context, "reuse.test", build_conf=self.REUSE).generate()
+        make_generator(context, "reuse.test", build_conf=self.REUSE).generate()
+
+        assert used_keys == [None, self.KEYS]
+
+    @pytest.mark.parametrize("fb_en", [True, False], ids=["incremental", "vfs"])
+    def test_keys_persist_across_sandboxed_builds(self, tmp_path, fb_en):
+        # CachedBuilder (fb_en) and --vfs build on a fresh in-memory sandbox each time
+        def build_fs():
+            return create_app_fs(use_vfs=True, fb_en=fb_en, chroot=DNSBPath(str(tmp_path)),
+                                 cache_root=DNSBPath(str(tmp_path / ".dnsb_cache")))
+
+        make_generator(make_context(build_fs()), "reuse.test", build_conf=self.REUSE)._store_zone_keys(self.KEYS)
+
+        (key_file,) = (tmp_path / ".dnsb_cache" / "keys").iterdir()
+        assert key_file.stat().st_mode & 0o777 == 0o600
+        generator = make_generator(make_context(build_fs()), "reuse.test", build_conf=self.REUSE)
+        assert generator._load_zone_keys() == self.KEYS
+
+    def test_relative_cache_root_resolves_against_chroot(self, tmp_path):
+        fs = create_app_fs(use_vfs=True, fb_en=True, chroot=DNSBPath(str(tmp_path)),
+                           cache_root=DNSBPath(".dnsb_cache"))
+
+        make_generator(make_context(fs), "reuse.test", build_conf=self.REUSE)._store_zone_keys(self.KEYS)
+
+        assert len(list((tmp_path / ".dnsb_cache" / "keys").iterdir())) == 1
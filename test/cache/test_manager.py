@@ -0,0 +1,91 @@
+# tests/cache/test_manager.py
+
+import os
+from types import SimpleNamespace
+
+import pytest
+
+from dnsbuilder.cache import view
+from dnsbuilder.cache.build import CachedBuilder
+from dnsbuilder.cache.manager import CacheManager
+from dnsbuilder.cache.view import FileCacheView, ProjectCacheView, ServiceCacheView, stat_mtime_ns
+from dnsbuilder.io import DNSBPath, create_app_fs
+
+
+@pytest.fixture
+def fs(tmp_path):
+    return create_app_fs(chroot=DNSBPath(str(tmp_path)))
+
+
+@pytest.fixture
+def manager(fs, tmp_path):
+    return CacheManager(fs, DNSBPath(str(tmp_path / ".dnsb_cache")))
+
+
+@pytest.fixture
+def service_dir(tmp_path):
+    path = tmp_path / "output" / "auth"
+    path.mkdir(parents=True)
+    (path / "named.conf").write_text("options { recursion no; };\n")
+    return path
+
+
+def synced_view(fs, service_dir, rel_path="named.conf"):
+    """FileCacheView of a file as _sync_service records it right after writing it."""
+    file_path = DNSBPath(str(service_dir / rel_path))
+    file_view = FileCacheView.from_file_path(file_path, fs)
+    file_view.set_rel_path(rel_path)
+    file_view.synced_mtime_ns = stat_mtime_ns(fs.stat(file_path))
+    return file_view
+
+
+def rewrite_same_size(path, content):
+    """Overwrite `path` with different content of the same size and a later mtime."""
+    stat = path.stat()
+    assert len(content) == stat.st_size and content != path.read_text()
+    path.write_text(content)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+def make_project(*files):
+    service = ServiceCacheView(name="auth", build_config={}, files={f.path: f for f in files})
+    return ProjectCacheView(name="demo", proj_config={}, output_dir="output", services={"auth": service})
+
+
+class TestFileConsistencyFastPath:
+    """Tests for the size + synced mtime shortcut of CacheManager._check_file_consistency."""
+
+    def test_unchanged_file_skips_rehash(self, fs, manager, service_dir, monkeypatch):
+        file_view = synced_view(fs, service_dir)
+        monkeypatch.setattr(view, "hash_content", lambda *args: pytest.fail("file was rehashed"))
+
+        assert manager._check_file_consistency(DNSBPath(str(service_dir)), "named.conf", file_view)
+
+    def test_same_size_change_is_detected(self, fs, manager, service_dir):
+        file_view = synced_view(fs, service_dir)
+
+        rewrite_same_size(service_dir / "named.conf", "options { recursion ya; };\n")
+
+        assert not manager._check_file_consistency(DNSBPath(str(service_dir)), "named.conf", file_view)
+
+    def test_touched_file_with_same_content_is_consistent(self, fs, manager, service_dir):
+        file_view = synced_view(fs, service_dir)
+        stat = (service_dir / "named.conf").stat()
+
+        os.utime(service_dir / "named.conf", ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        assert manager._check_file_consistency(DNSBPath(str(service_dir)), "named.conf", file_view)
+
+    def test_same_size_change_is_detected_after_carrying_mtimes(self, fs, manager, service_dir):
+        # The service is unchanged in the next build, so CachedBuilder carries the synced mtime over
+        existing = synced_view(fs, service_dir)
+        rebuilt = FileCacheView(path="named.conf", content_hash=existing.content_hash,
+                                size=existing.size, mtime=0.0)
+        builder = SimpleNamespace(project_cache=make_project(existing), memory_project_cache=make_project(rebuilt))
+        CachedBuilder._carry_synced_mtimes(builder, "auth")
+        assert rebuilt.synced_mtime_ns == existing.synced_mtime_ns
+
+        rewrite_same_size(service_dir / "named.conf", "options { recursion ya; };\n")
+
+        service_cache = builder.memory_project_cache.get_service("auth")
+        assert not manager._check_service_consistency(service_cache, DNSBPath(str(service_dir)))
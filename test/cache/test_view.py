@@ -0,0 +1,146 @@
+# tests/cache/test_view.py
+
+import pytest
+
+from dnsbuilder.cache.view import FileCacheView, ServiceCacheView
+from dnsbuilder.io import DNSBPath, create_app_fs
+
+
+class WalkRecordingFS:
+    """Proxies a file system and records every directory its walk visits."""
+
+    def __init__(self, fs):
+        self._fs = fs
+        self.visited = []
+
+    def __getattr__(self, name):
+        return getattr(self._fs, name)
+
+    def walk(self, path):
+        for dirpath, dirnames, filenames in self._fs.walk(path):
+            self.visited.append(str(self._fs.relative_to(dirpath, path)))
+            yield dirpath, dirnames, filenames
+
+
+def make_file(path, content_hash="abc", size=3):
+    return FileCacheView(path=path, content_hash=content_hash, size=size, mtime=0.0)
+
+
+def make_service(*files):
+    return ServiceCacheView(name="svc", build_config={"image": "bind"}, ip="10.0.0.2",
+                            files={f.path: f for f in files})
+
+
+def fresh_hashes(view):
+    """Hashes of an unmemoized copy of `view`."""
+    copy = ServiceCacheView.model_validate(view.model_dump())
+    return copy.get_consistency_hash(), copy.get_update_hash()
+
+
+@pytest.fixture
+def project(tmp_path):
+    for rel in ("named.conf", "build/keep.txt", "build/out.log", "build/sub/deep.log", "zones/db.test"):
+        (tmp_path / rel).parent.mkdir(parents=True, exist_ok=True)
+        (tmp_path / rel).write_text(rel)
+    return WalkRecordingFS(create_app_fs(chroot=DNSBPath(str(tmp_path))))
+
+
+def scan(fs, tmp_path, **kwargs):
+    view = ServiceCacheView(name="svc", build_config={})
+    view.scan(DNSBPath(str(tmp_path)), fs, **kwargs)
+    return view
+
+
+class TestServiceCacheViewScan:
+    """Tests for ServiceCacheView.scan and its ignore-pattern pruning."""
+
+    def test_dir_prune_patterns(self):
+        patterns = ["build/**", "**/node_modules/**", "*.log", "**/.git", "zones/*.jnl"]
+
+        assert ServiceCacheView._dir_prune_patterns(patterns) == ["build", "**/node_modules"]
+
+    def test_pruned_pattern_skips_directory(self, project, tmp_path):
+        view = scan(project, tmp_path, ignore_patterns=["build/**"])
+
+        assert sorted(view.files) == ["named.conf", "zones/db.test"]
+        assert "build" not in project.visited
+        assert "build/sub" not in project.visited
+
+    def test_file_pattern_still_walks_directory(self, project, tmp_path):
+        view = scan(project, tmp_path, ignore_patterns=["build/*.log"])
+
+        assert sorted(view.files) == ["build/keep.txt", "named.conf", "zones/db.test"]
+        assert {"build", "build/sub"} <= set(project.visited)
+
+    def test_pruning_matches_per_file_filtering(self, project, tmp_path):
+        pruned = scan(project, tmp_path, ignore_patterns=["**/sub/**", "zones/**"])
+        per_file = scan(project, tmp_path, ignore_patterns=["*/sub/*", "zones/*"])
+
+        assert sorted(pruned.files) == sorted(per_file.files) == ["build/keep.txt", "build/out.log", "named.conf"]
+        assert pruned.get_consistency_hash() == per_file.get_consistency_hash()
+
+    def test_no_ignore_scans_everything(self, project, tmp_path):
+        view = scan(project, tmp_path, is_ignore=False, ignore_patterns=["build/**"])
+
+        assert sorted(view.files) == [
+            "build/keep.txt", "build/out.log", "build/sub/deep.log", "named.conf", "zones/db.test",
+        ]
+        assert view.files["build/sub/deep.log"].size == len("build/sub/deep.log")
+
+
+class TestCacheViewHashMemo:
+    """Tests that memoized cache view digests follow mutations."""
+
+    def test_add_file_invalidates(self):
+        view = make_service(make_file("a.conf"))
+        before = view.get_consistency_hash(), view.get_update_hash()
+
+        view.add_file(make_file("b.conf"))
+
+        assert (view.get_consistency_hash(), view.get_update_hash()) != before
+        assert (view.get_consistency_hash(), view.get_update_hash()) == fresh_hashes(view)
+
+    def test_replacing_file_invalidates(self):
+        view = make_service(make_file("a.conf"))
+        before = view.get_consistency_hash()
+
+        view.add_file(make_file("a.conf", content_hash="def"))
+
+        assert view.get_consistency_hash() != before
+        assert (view.get_consistency_hash(), view.get_update_hash()) == fresh_hashes(view)
+
+    def test_remove_file_invalidates(self):
+        view = make_service(make_file("a.conf"), make_file("b.conf"))
+        view.get_consistency_hash(), view.get_update_hash()
+
+        view.remove_file("b.conf")
+
+        assert (view.get_consistency_hash(), view.get_update_hash()) == fresh_hashes(view)
+        assert view.get_consistency_hash() == make_service(make_file("a.conf")).get_consistency_hash()
+
+    def test_field_assignment_invalidates(self):
+        view = make_service(make_file("a.conf"))
+        before = view.get_update_hash()
+
+        view.ip = "10.0.0.3"
+
+        assert view.get_update_hash() != before
+        assert view.get_update_hash() == fresh_hashes(view)[1]
+
+    def test_set_rel_path_invalidates(self):
+        file_view = make_file("/abs/a.conf")
+        before = file_view.get_consistency_hash()
+
+        file_view.set_rel_path("a.conf")
+
+        assert file_view.get_consistency_hash() != before
+        assert file_view.get_consistency_hash() == make_file("a.conf").get_consistency_hash()
+
+    def test_scan_invalidates(self, project, tmp_path):
+        view = make_service()
+        empty = view.get_consistency_hash()
+
+        view.scan(DNSBPath(str(tmp_path)), project, ignore_patterns=[])
+
+        assert view.get_consistency_hash() != empty
+        assert (view.get_consistency_hash(), view.get_update_hash()) == fresh_hashes(view)
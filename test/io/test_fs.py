@@ -0,0 +1,170 @@
+# tests/io/test_fs.py
+
+import pytest
+
+from dnsbuilder.exceptions import ReadOnlyError
+from dnsbuilder.io import DNSBPath, HyperMemoryFileSystem, create_app_fs
+
+
+class RecordingMemoryFileSystem(HyperMemoryFileSystem):
+    """In-memory file system that records the batches it is asked to write."""
+
+    def __init__(self):
+        super().__init__()
+        self.batches = []
+
+    def write_many(self, items):
+        items = list(items)
+        self.batches.append(items)
+        super().write_many(items)
+
+
+@pytest.fixture
+def disk_fs(tmp_path):
+    return create_app_fs(chroot=DNSBPath(str(tmp_path)))
+
+
+@pytest.fixture
+def sandbox_fs(tmp_path):
+    return create_app_fs(use_vfs=True, chroot=DNSBPath(str(tmp_path)))
+
+
+class TestWriteMany:
+    """Tests for FileSystem.write_many across handlers."""
+
+    def test_groups_items_by_handler(self, disk_fs):
+        temp_fs, key_fs = RecordingMemoryFileSystem(), RecordingMemoryFileSystem()
+        disk_fs.register_handler("temp", temp_fs)
+        disk_fs.register_handler("key", key_fs)
+
+        disk_fs.write_many([
+            (DNSBPath("temp:/a/one.txt"), "1"),
+            (DNSBPath("key:/svc/zone.ksk.key"), "ksk"),
+            (DNSBPath("temp:/a/two.txt"), "2"),
+            (DNSBPath("key:/svc/zone.zsk.key"), "zsk"),
+        ])
+
+        assert [[str(path) for path, _ in batch] for batch in temp_fs.batches] == [["temp:/a/one.txt", "temp:/a/two.txt"]]
+        assert [[content for _, content in batch] for batch in key_fs.batches] == [["ksk", "zsk"]]
+        assert disk_fs.read_text(DNSBPath("temp:/a/two.txt")) == "2"
+        assert disk_fs.read_text(DNSBPath("key:/svc/zone.zsk.key")) == "zsk"
+
+    def test_empty_batch_writes_nothing(self, disk_fs):
+        temp_fs = RecordingMemoryFileSystem()
+        disk_fs.register_handler("temp", temp_fs)
+
+        disk_fs.write_many([])
+
+        assert temp_fs.batches == []
+
+    def test_creates_missing_parent_directories(self):
+        fs = HyperMemoryFileSystem()
+
+        fs.write_many([
+            (DNSBPath("/deep/nested/one.txt"), "1"),
+            (DNSBPath("/deep/nested/two.txt"), "2"),
+            (DNSBPath("/other/three.txt"), "3"),
+        ])
+
+        assert fs.read_text(DNSBPath("/deep/nested/two.txt")) == "2"
+        assert fs.read_text(DNSBPath("/other/three.txt")) == "3"
+
+    def test_resolves_relative_paths_against_chroot(self, disk_fs, tmp_path):
+        disk_fs.write_many([(DNSBPath("out/a.txt"), "a"), (DNSBPath("out/b.txt"), "b")])
+
+        assert (tmp_path / "out" / "a.txt").read_text() == "a"
+        assert (tmp_path / "out" / "b.txt").read_text() == "b"
+
+    def test_sandbox_keeps_writes_off_disk(self, sandbox_fs, tmp_path):
+        (tmp_path / "keep.txt").write_text("disk")
+
+        sandbox_fs.write_many([(DNSBPath("keep.txt"), "memory"), (DNSBPath("new/file.txt"), "new")])
+
+        assert sandbox_fs.read_text(DNSBPath("keep.txt")) == "memory"
+        assert sandbox_fs.read_text(DNSBPath("new/file.txt")) == "new"
+        assert (tmp_path / "keep.txt").read_text() == "disk"
+        assert not (tmp_path / "new").exists()
+
+    def test_read_only_handler_rejects_batch(self, disk_fs):
+        with pytest.raises(ReadOnlyError):
+            disk_fs.write_many([(DNSBPath("resource:/images/new.txt"), "x")])
+
+
+def walk_tree(fs, root):
+    """Walk `root` into {relative dir: (sorted dirnames, sorted filenames)}."""
+    tree = {}
+    for dirpath, dirnames, filenames in fs.walk(root):
+        rel = str(dirpath)[len(str(root)):].strip("/") or "."
+        tree[rel] = (sorted(dirnames), sorted(filenames))
+    return tree
+
+
+def make_tree(fs, root):
+    for rel in ("top.txt", "a/one.txt", "a/b/two.txt", "c/three.txt"):
+        fs.write_text(root / rel, rel)
+
+
+TREE = {
+    ".": (["a", "c"], ["top.txt"]),
+    "a": (["b"], ["one.txt"]),
+    "a/b": ([], ["two.txt"]),
+    "c": ([], ["three.txt"]),
+}
+
+
+class TestWalk:
+    """Tests for FileSystem.walk across handlers."""
+
+    def test_memory_fs(self):
+        fs = HyperMemoryFileSystem()
+        root = DNSBPath("/project")
+        make_tree(fs, root)
+
+        assert walk_tree(fs, root) == TREE
+
+    def test_disk_fs(self, disk_fs, tmp_path):
+        root = DNSBPath(str(tmp_path / "project"))
+        make_tree(disk_fs, root)
+
+        assert walk_tree(disk_fs, root) == TREE
+
+    def test_app_fs_delegates_by_protocol(self, disk_fs):
+        make_tree(disk_fs, DNSBPath("temp:/project"))
+
+        assert walk_tree(disk_fs, DNSBPath("temp:/project")) == TREE
+
+    def test_pruned_dirnames_are_not_descended(self):
+        fs = HyperMemoryFileSystem()
+        root = DNSBPath("/project")
+        make_tree(fs, root)
+
+        visited = []
+        for dirpath, dirnames, _ in fs.walk(root):
+            visited.append(str(dirpath))
+            dirnames[:] = [name for name in dirnames if name != "a"]
+
+        assert visited == ["/project", "/project/c"]
+
+    def test_sandbox_walks_memory_layer_only(self, sandbox_fs, tmp_path):
+        (tmp_path / "project" / "disk").mkdir(parents=True)
+        (tmp_path / "project" / "disk" / "on_disk.txt").write_text("disk")
+        root = DNSBPath(str(tmp_path / "project"))
+        make_tree(sandbox_fs, root)
+
+        assert walk_tree(sandbox_fs, root) == TREE
+
+    def test_sandbox_with_fallback_merges_layers(self, tmp_path):
+        fs = create_app_fs(use_vfs=True, fb_en=True, chroot=DNSBPath(str(tmp_path)))
+        (tmp_path / "project" / "a").mkdir(parents=True)
+        (tmp_path / "project" / "a" / "on_disk.txt").write_text("disk")
+        (tmp_path / "project" / "disk").mkdir()
+        (tmp_path / "project" / "disk" / "deep.txt").write_text("disk")
+        root = DNSBPath(str(tmp_path / "project"))
+        make_tree(fs, root)
+
+        tree = walk_tree(fs, root)
+
+        assert tree["."] == (["a", "c", "disk"], ["top.txt"])
+        assert tree["a"] == (["b"], ["on_disk.txt", "one.txt"])
+        assert tree["disk"] == ([], ["deep.txt"])
+        assert not (tmp_path / "project" / "top.txt").exists()
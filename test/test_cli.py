@@ -0,0 +1,259 @@
+# tests/test_cli.py
+
+import io
+from types import SimpleNamespace
+
+import pytest
+import python_on_whales
+from click.testing import CliRunner
+
+from dnsbuilder.cli import cli, _read_project_name, _read_yaml_outline, _resolve_project, _yaml_safe_loader
+from dnsbuilder.config import Config
+from dnsbuilder.exceptions import ConfigValidationError
+from dnsbuilder.io import DNSBPath, create_app_fs
+
+INET = "inet: 10.88.0.0/16\n"
+
+
+def outline(text, keys):
+    return _read_yaml_outline(io.StringIO(text), keys, _yaml_safe_loader())
+
+
+class FakeImageCLI:
+    """Stands in for python_on_whales' docker.image, recording list/remove calls."""
+
+    def __init__(self, images):
+        self.images = images
+        self.list_calls = []
+        self.removed = []
+
+    def list(self, *args, **kwargs):
+        self.list_calls.append((args, kwargs))
+        return self.images
+
+    def remove(self, ids, force=False):
+        self.removed.extend([ids] if isinstance(ids, str) else ids)
+
+    def exists(self, image_id):
+        return image_id not in self.removed
+
+
+@pytest.fixture
+def fake_docker(monkeypatch):
+    def install(images):
+        docker = SimpleNamespace(image=FakeImageCLI(images))
+        monkeypatch.setattr(python_on_whales, "docker", docker)
+        return docker.image
+    return install
+
+
+class FakeComposeClient:
+    """Stands in for python_on_whales.DockerClient, listing the given containers."""
+
+    containers = []
+
+    def __init__(self, compose_files=None, **kwargs):
+        self.compose = SimpleNamespace(ps=lambda: self.containers)
+
+
+def make_container(name, ports=None):
+    return SimpleNamespace(
+        name=name,
+        state=SimpleNamespace(status="running"),
+        network_settings=SimpleNamespace(ports=ports),
+    )
+
+
+def binding(host_port, host_ip="0.0.0.0"):
+    return SimpleNamespace(host_ip=host_ip, host_port=host_port)
+
+
+@pytest.fixture
+def write_config(tmp_path):
+    def write(text, filename="config.yml"):
+        path = tmp_path / filename
+        path.write_text(text)
+        return str(path)
+    return write
+
+
+@pytest.fixture
+def fs(tmp_path):
+    return create_app_fs(chroot=DNSBPath(str(tmp_path)))
+
+
+class TestReadYamlOutline:
+    """Tests for reading top-level YAML entries from parse events."""
+
+    @pytest.mark.parametrize(
+        "text, expected",
+        [
+            ("name: demo\n", {"name": "demo"}),
+            ("name: 'quoted: yes'\n", {"name": "quoted: yes"}),
+            ("name: |\n  block\n", {"name": "block\n"}),
+            ("name: >-\n  folded\n  text\n", {"name": "folded text"}),
+            ("name: !!str 123\n", {"name": "123"}),
+            ("{name: flow, other: 1}\n", {"name": "flow"}),
+            ("name: 123\n", {"name": None}),
+            ("name: true\n", {"name": None}),
+            ("name: ~\n", {"name": None}),
+            ("name:\n", {"name": None}),
+            ("name: [a, b]\n", {"name": None}),
+            ("base: &b demo\nname: *b\n", {"name": None}),
+            ("other: 1\n", {}),
+            ("- name\n", {}),
+            ("", {}),
+        ],
+    )
+    def test_scalar_values(self, text, expected):
+        assert outline(text, ["name"]) == expected
+
+    def test_mapping_value_lists_its_keys(self):
+        text = "services:\n  dns1:\n    image: bind\n    ports: {a: 1}\n  dns2: {}\n  'dns 3': null\n"
+
+        assert outline(text, ["services"]) == {"services": ["dns1", "dns2", "dns 3"]}
+
+    def test_nested_keys_are_not_top_level(self):
+        text = "builds:\n  name: nested\n  inner:\n    name: deeper\nname: top\n"
+
+        assert outline(text, ["name"]) == {"name": "top"}
+
+    def test_reads_several_keys(self):
+        text = "name: demo\n" + INET + "services:\n  a: 1\n"
+
+        assert outline(text, ["name", "services"]) == {"name": "demo", "services": ["a"]}
+
+    def test_stops_after_the_wanted_keys(self):
+        # The rest of the document is invalid and must never be parsed
+        assert outline("name: demo\nbuilds: [unclosed\n", ["name"]) == {"name": "demo"}
+        assert outline("services:\n  a: 1\nname: [unclosed\n", ["services"]) == {"services": ["a"]}
+
+    def test_reads_only_the_first_document(self):
+        assert outline("other: 1\n---\nname: second\n", ["name"]) == {}
+
+
+class TestReadProjectName:
+    """Tests that the fast path only returns names Config would use unchanged."""
+
+    @pytest.mark.parametrize(
+        "text",
+        [
+            "name: demo\n" + INET,
+            INET + "builds: {}\nname: late\n",
+            "name: 'quoted name'\n" + INET,
+            "name: \"${PROJECT}\"\n" + INET,
+            "name: !!str 2024\n" + INET,
+            "name: |-\n  multi\n  line\n" + INET,
+            "name: démo\n" + INET,
+        ],
+    )
+    def test_matches_config_name(self, write_config, fs, text):
+        path = write_config(text)
+
+        assert _read_project_name(path, fs) == Config(path, fs).name
+
+    @pytest.mark.parametrize("value", ["123", "1.5", "true", "no", "2024-01-01", "~", "''", "[demo]"])
+    def test_non_str_names_are_left_to_config(self, write_config, fs, value):
+        path = write_config(f"name: {value}\n" + INET)
+
+        assert _read_project_name(path, fs) is None
+
+    def test_int_name_fails_config_validation(self, write_config, fs):
+        path = write_config("name: 123\n" + INET)
+
+        with pytest.raises(ConfigValidationError):
+            Config(path, fs)
+
+    def test_alias_name_resolves_through_config(self, write_config, fs):
+        path = write_config("base: &b aliased\nname: *b\n" + INET)
+
+        assert _read_project_name(path, fs) is None
+        assert _resolve_project(path)[0] == Config(path, fs).name == "aliased"
+
+    def test_included_name_resolves_through_config(self, write_config, fs, tmp_path):
+        write_config("name: from-include\n" + INET, "base.yml")
+        path = write_config("include: base.yml\n")
+
+        assert _read_project_name(path, fs) is None
+        project_name, compose_file = _resolve_project(path)
+        assert project_name == Config(path, fs).name == "from-include"
+        assert compose_file == DNSBPath(str(tmp_path)) / "output" / "from-include" / "docker-compose.yml"
+
+    def test_top_level_name_overrides_include(self, write_config, fs):
+        write_config("name: from-include\n" + INET, "base.yml")
+        path = write_config("include: base.yml\nname: top\n")
+
+        assert _read_project_name(path, fs) == Config(path, fs).name == "top"
+
+
+class TestClean:
+    """Tests for `dnsb clean` image selection."""
+
+    IMAGES = [
+        SimpleNamespace(id="sha256:" + "a" * 64, repo_tags=["dnsb-bind-9.18.4-3dd6ed5f:latest"]),
+        SimpleNamespace(id="sha256:" + "b" * 64, repo_tags=["dnsb-unbound-1.19.0-9c1e0b2a:latest"]),
+    ]
+
+    def test_all_uses_reference_filter(self, fake_docker):
+        image_cli = fake_docker(self.IMAGES)
+
+        result = CliRunner().invoke(cli, ["clean", "--all"])
+
+        assert result.exit_code == 0, result.output
+        assert image_cli.list_calls == [(("dnsb-*",), {})]
+        assert image_cli.removed == [image.id for image in self.IMAGES]
+
+    def test_project_uses_reference_filter(self, fake_docker, write_config):
+        image_cli = fake_docker(self.IMAGES[:1])
+        path = write_config("name: demo\n" + INET)
+
+        result = CliRunner().invoke(cli, ["clean", path])
+
+        assert result.exit_code == 0, result.output
+        assert image_cli.list_calls == [(("demo-*",), {})]
+        assert image_cli.removed == [self.IMAGES[0].id]
+
+    def test_nothing_to_clean(self, fake_docker):
+        image_cli = fake_docker([])
+
+        result = CliRunner().invoke(cli, ["clean", "--all"])
+
+        assert result.exit_code == 0, result.output
+        assert image_cli.removed == []
+
+
+class TestPs:
+    """Tests for the `dnsb ps` container table."""
+
+    @pytest.fixture
+    def run_ps(self, monkeypatch, write_config, tmp_path):
+        path = write_config("name: demo\n" + INET)
+        compose_file = tmp_path / "output" / "demo" / "docker-compose.yml"
+        compose_file.parent.mkdir(parents=True)
+        compose_file.write_text("services: {}\n")
+
+        def run(containers):
+            monkeypatch.setattr(FakeComposeClient, "containers", containers)
+            monkeypatch.setattr(python_on_whales, "DockerClient", FakeComposeClient)
+            result = CliRunner().invoke(cli, ["ps", path])
+            assert result.exit_code == 0, result.output
+            return result.output.splitlines()
+        return run
+
+    def test_published_ports(self, run_ps):
+        ports = {
+            "53/udp": [binding("5353"), binding("5353", host_ip="::")],
+            "53/tcp": [binding("5354")],
+            "8080/tcp": None,
+        }
+
+        header, rule, line = run_ps([make_container("demo-auth-1", ports)])
+
+        assert header.split() == ["NAME", "STATUS", "PORTS"]
+        assert set(rule) == {"-"}
+        assert line.split(None, 2) == ["demo-auth-1", "running", "5353->53/udp, 5353->53/udp, 5354->53/tcp"]
+
+    def test_containers_without_ports(self, run_ps):
+        lines = run_ps([make_container("demo-auth-1"), make_container("demo-rec-1", {"53/udp": None})])
+
+        assert [line.split() for line in lines[2:]] == [["demo-auth-1", "running"], ["demo-rec-1", "running"]]